@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import TYPE_CHECKING
@@ -10,10 +11,31 @@ from kaleidescape import Kaleidescape
 from kaleidescape.error import KaleidescapeError
 
 from homeassistant.components.media_player.const import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.const import CONF_HOST, CONF_ID, EVENT_HOMEASSISTANT_STOP
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import DOMAIN, MANAGER, NAME as KALEIDESCAPE_NAME
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .artwork import ArtworkCache
+from .bridge import EventBridge
+from .const import (
+    CONF_BRIDGE_EVENTS,
+    CONF_BRIDGE_RATE_LIMIT,
+    CONF_REVALIDATE,
+    DEFAULT_BRIDGE_RATE_LIMIT,
+    DEFAULT_CONNECT_TIMEOUT,
+    DOMAIN,
+    MANAGER,
+    NAME as KALEIDESCAPE_NAME,
+    SIGNAL_DEVICES_UPDATED,
+)
+from .models import KaleidescapeEntryData
+from .scheduler import CommandScheduler
+from .screen_mask import async_setup_screen_mask_signal
+from .services import async_setup_services, async_unload_services
+from .subscription import SubscriptionDispatcher, subscribed_events
+from .usage import WatchStatistics
+from .watchdog import ConnectionWatchdog
 
 if TYPE_CHECKING:
     from kaleidescape import SystemInfo
@@ -21,6 +43,8 @@ if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+PLATFORMS = [MEDIA_PLAYER_DOMAIN, SENSOR_DOMAIN]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -28,13 +52,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Kaleidescape from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    controller = Kaleidescape(entry.data[CONF_HOST], timeout=5)
+    if not entry.data.get(CONF_ID):
+        # Migrated entry without any id, look the system up by host instead
+        hass.async_create_task(async_revalidate_entry(hass, entry))
+        raise ConfigEntryNotReady(f"System id of {entry.title} is not known yet")
+
+    controller = Kaleidescape(entry.data[CONF_HOST], timeout=DEFAULT_CONNECT_TIMEOUT)
 
     try:
         await controller.connect(entry.data[CONF_ID], auto_reconnect=True)
         await controller.load_devices()
     except (KaleidescapeError, ConnectionError) as err:
         await controller.disconnect()
+        if entry.data.get(CONF_REVALIDATE):
+            # The placeholder id may be what fails, the next retry uses the real one
+            hass.async_create_task(async_revalidate_entry(hass, entry))
         _LOGGER.error("Unable to connect: %s", err)
         raise ConfigEntryNotReady from err
 
@@ -45,35 +77,120 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, disconnect)
     )
 
-    hass.data[DOMAIN][entry.entry_id] = controller
+    watchdog = ConnectionWatchdog(hass, entry.entry_id, controller, entry.data[CONF_ID])
+
+    devices = await controller.get_devices()
+
+    schedulers = {
+        device.serial_number: CommandScheduler(
+            device, get_timeout=lambda: watchdog.command_timeout
+        )
+        for device in devices
+        if device.is_movie_player
+    }
+
+    dispatcher = controller.dispatcher
+    if (events := subscribed_events(entry.options)) is not None:
+        dispatcher = SubscriptionDispatcher(controller.dispatcher, events)
+        entry.async_on_unload(dispatcher.async_stop)
+
+    entry.async_on_unload(async_setup_screen_mask_signal(hass, dispatcher, devices))
+
+    bridge = None
+    if bridge_events := entry.options.get(CONF_BRIDGE_EVENTS):
+        bridge = EventBridge(
+            hass,
+            dispatcher,
+            devices,
+            bridge_events,
+            entry.options.get(CONF_BRIDGE_RATE_LIMIT, DEFAULT_BRIDGE_RATE_LIMIT),
+        )
+        bridge.async_start()
+
+    statistics = WatchStatistics(hass, entry.entry_id, dispatcher, devices)
+    await statistics.async_load()
+    statistics.async_start()
+
+    hass.data[DOMAIN][entry.entry_id] = KaleidescapeEntryData(
+        controller=controller,
+        devices=devices,
+        dispatcher=dispatcher,
+        watchdog=watchdog,
+        schedulers=schedulers,
+        artwork=ArtworkCache(hass),
+        statistics=statistics,
+        bridge=bridge,
+    )
+
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    async_setup_services(hass)
+
+    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+
+    watchdog.async_start()
 
-    await hass.config_entries.async_forward_entry_setup(entry, MEDIA_PLAYER_DOMAIN)
+    async_dispatcher_send(hass, SIGNAL_DEVICES_UPDATED)
+
+    if entry.data.get(CONF_REVALIDATE):
+        hass.async_create_task(async_revalidate_entry(hass, entry))
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload config entry."""
-    controller: Kaleidescape = hass.data[DOMAIN][entry.entry_id]
-    await controller.disconnect()
-    await hass.config_entries.async_forward_entry_unload(entry, MEDIA_PLAYER_DOMAIN)
+    data: KaleidescapeEntryData = hass.data[DOMAIN][entry.entry_id]
+    await data.watchdog.async_stop()
+    data.statistics.async_stop()
+    if data.bridge:
+        data.bridge.async_stop()
+    await data.controller.disconnect()
+    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    await data.statistics.async_save()
     del hass.data[DOMAIN][entry.entry_id]
+    async_dispatcher_send(hass, SIGNAL_DEVICES_UPDATED)
+    if not hass.data[DOMAIN]:
+        async_unload_services(hass)
     return True
 
 
+async def async_revalidate_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Replace placeholder identifiers of a migrated entry with the system's."""
+    try:
+        system = await get_system_info(entry.data[CONF_HOST])
+    except (KaleidescapeError, ConnectionError, asyncio.TimeoutError) as err:
+        _LOGGER.warning(
+            "Unable to revalidate %s, retrying on next setup: %s", entry.title, err
+        )
+        return
+
+    hass.config_entries.async_update_entry(
+        entry,
+        unique_id=system.system_id,
+        title=f"Kaleidescape ({system.friendly_name})",
+        data={CONF_ID: system.system_id, CONF_HOST: system.ip_address},
+    )
+    _LOGGER.info("Revalidated %s", entry.title)
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload entry when its options or data change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_migrate_entry(hass, entry: ConfigEntry):
     """Migrate old entries."""
     _LOGGER.debug("Migrating from version %s", entry.version)
 
     if entry.version == 1:
-        system = await get_system_info(entry.data[CONF_HOST])
+        # Migrate without touching the network. The old identifiers stay as
+        # placeholders until the system is revalidated in the background.
+        data = {CONF_HOST: entry.data[CONF_HOST], CONF_REVALIDATE: True}
+        if system_id := entry.data.get(CONF_ID, entry.unique_id):
+            data[CONF_ID] = system_id
         entry.version = 2
-        hass.config_entries.async_update_entry(
-            entry,
-            unique_id=system.system_id,
-            title=f"Kaleidescape ({system.friendly_name})",
-            data={CONF_ID: system.system_id, CONF_HOST: system.ip_address},
-        )
+        hass.config_entries.async_update_entry(entry, data=data)
 
     _LOGGER.info("Migration to version %s successful", entry.version)
 
@@ -87,6 +204,6 @@ def validate_host(host: str) -> bool:
 
 async def get_system_info(host: str) -> SystemInfo:
     """Returns system info if host is valid."""
-    controller = Kaleidescape(host, timeout=5)
+    controller = Kaleidescape(host, timeout=DEFAULT_CONNECT_TIMEOUT)
     system_id = await controller.discover()
     return controller.systems[system_id]
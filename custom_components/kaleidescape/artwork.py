@@ -0,0 +1,114 @@
+"""Cover art thumbnails and color palettes for Kaleidescape titles."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import io
+import logging
+from typing import TYPE_CHECKING, NamedTuple
+
+import aiohttp
+from PIL import Image
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+THUMBNAIL_SIZE = (320, 320)
+THUMBNAIL_QUALITY = 85
+PALETTE_SIZE = 5
+PALETTE_SAMPLE_SIZE = (64, 64)
+FETCH_TIMEOUT = 10
+MAX_ARTWORK = 50
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Artwork(NamedTuple):
+    """Processed cover art of a title."""
+
+    thumbnail: bytes
+    content_type: str
+    palette: tuple[str, ...]
+
+
+def process_cover(data: bytes) -> Artwork:
+    """Returns thumbnail and dominant colors of cover image data.
+
+    CPU bound, must run in an executor.
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        rgb = image.convert("RGB")
+
+    rgb.thumbnail(THUMBNAIL_SIZE)
+    output = io.BytesIO()
+    rgb.save(output, format="JPEG", quality=THUMBNAIL_QUALITY)
+
+    sample = rgb.resize(PALETTE_SAMPLE_SIZE)
+    quantized = sample.quantize(colors=PALETTE_SIZE)
+    colors = quantized.getpalette()
+    palette = tuple(
+        "#{:02x}{:02x}{:02x}".format(*colors[index * 3 : index * 3 + 3])
+        for _, index in sorted(quantized.getcolors(), reverse=True)
+    )
+
+    return Artwork(output.getvalue(), "image/jpeg", palette)
+
+
+class ArtworkCache:
+    """Least recently used cache of processed cover art, keyed by content handle.
+
+    Images are fetched once per handle, concurrent requests for the same handle
+    share one fetch, and all image work runs in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize cache."""
+        self._hass = hass
+        self._artwork: OrderedDict[str, Artwork | None] = OrderedDict()
+        self._pending: dict[str, asyncio.Future] = {}
+
+    def get(self, handle: str | None) -> Artwork | None:
+        """Returns processed artwork for handle if available."""
+        if not handle or (artwork := self._artwork.get(handle)) is None:
+            return None
+        self._artwork.move_to_end(handle)
+        return artwork
+
+    async def async_get(self, handle: str, url: str) -> Artwork | None:
+        """Returns processed artwork for handle, fetching it from url if needed."""
+        if handle in self._artwork:
+            return self.get(handle)
+
+        if (pending := self._pending.get(handle)) is not None:
+            return await asyncio.shield(pending)
+
+        pending = self._pending[handle] = self._hass.loop.create_future()
+        try:
+            artwork = await self._async_fetch(url)
+            # Failures are cached too, so a bad image is not fetched on every event
+            self._artwork[handle] = artwork
+            while len(self._artwork) > MAX_ARTWORK:
+                self._artwork.popitem(last=False)
+            pending.set_result(artwork)
+        finally:
+            del self._pending[handle]
+            if not pending.done():
+                pending.cancel()
+
+        return artwork
+
+    async def _async_fetch(self, url: str) -> Artwork | None:
+        session = async_get_clientsession(self._hass)
+        try:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+                data = await response.read()
+            return await self._hass.async_add_executor_job(process_cover, data)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError) as err:
+            _LOGGER.debug("Unable to process cover art %s: %s", url, err)
+            return None
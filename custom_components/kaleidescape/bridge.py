@@ -0,0 +1,118 @@
+"""Republishes Kaleidescape device events on the Home Assistant event bus."""
+
+from __future__ import annotations
+
+from functools import partial
+import time
+from typing import TYPE_CHECKING, Any
+
+from kaleidescape import const as kaleidescape_const
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import EVENT_KALEIDESCAPE
+from .events import device_event_data
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from kaleidescape import Device as KaleidescapeDevice, Dispatcher
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+
+class EventBridge:
+    """Fires allowed device events as kaleidescape_event bus events.
+
+    Each device and event type pair fires at most once per rate limit interval.
+    Events arriving inside the interval are coalesced, and the latest payload is
+    fired when the interval ends.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        dispatcher: Dispatcher,
+        devices: list[KaleidescapeDevice],
+        events: list[str],
+        rate_limit: float,
+    ) -> None:
+        """Initialize bridge."""
+        self._hass = hass
+        self._dispatcher = dispatcher
+        self._devices = devices
+        self._events = frozenset(events)
+        self._rate_limit = rate_limit
+        self._signal = None
+        self._last_fired: dict[tuple[str, str], float] = {}
+        self._pending: dict[tuple[str, str], dict[str, Any]] = {}
+        self._timers: dict[tuple[str, str], CALLBACK_TYPE] = {}
+        self.fired = 0
+        self.coalesced = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start listening for device events."""
+        self._signal = self._dispatcher.connect(
+            kaleidescape_const.SIGNAL_DEVICE_EVENT, self._async_device_event
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening and drop coalesced events."""
+        if self._signal:
+            self._signal.disconnect()
+            self._signal = None
+        for cancel in self._timers.values():
+            cancel()
+        self._timers.clear()
+        self._pending.clear()
+
+    @callback
+    def _async_device_event(self, device_id: str, event: str) -> None:
+        """Handle device event from the controller."""
+        if event not in self._events:
+            return
+
+        device = next((d for d in self._devices if d.has_device_id(device_id)), None)
+        if device is None:
+            return
+
+        key = (device.serial_number, event)
+        payload = {
+            "serial_number": device.serial_number,
+            "event": event,
+            **device_event_data(device, event),
+        }
+
+        if key in self._timers:
+            # Inside the rate limit window, keep the latest payload only
+            self._pending[key] = payload
+            self.coalesced += 1
+            return
+
+        elapsed = time.monotonic() - self._last_fired.get(key, float("-inf"))
+        if elapsed >= self._rate_limit:
+            self._async_fire(key, payload)
+            return
+
+        self._pending[key] = payload
+        self._timers[key] = async_call_later(
+            self._hass,
+            self._rate_limit - elapsed,
+            partial(self._async_fire_pending, key),
+        )
+
+    @callback
+    def _async_fire_pending(self, key: tuple[str, str], now: datetime) -> None:
+        """Fire the latest coalesced payload once the interval has passed."""
+        self._timers.pop(key, None)
+        if (payload := self._pending.pop(key, None)) is not None:
+            self._async_fire(key, payload)
+
+    @callback
+    def _async_fire(self, key: tuple[str, str], payload: dict[str, Any]) -> None:
+        self._last_fired[key] = time.monotonic()
+        self.fired += 1
+        self._hass.bus.async_fire(EVENT_KALEIDESCAPE, payload)
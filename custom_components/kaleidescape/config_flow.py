@@ -8,10 +8,24 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_ID
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 
 from . import get_system_info, validate_host
-from .const import DEFAULT_HOST, DOMAIN
+from .const import (
+    CONF_BRIDGE_EVENTS,
+    CONF_BRIDGE_RATE_LIMIT,
+    CONF_EVENTS,
+    CONF_PROFILE,
+    DEFAULT_BRIDGE_RATE_LIMIT,
+    DEFAULT_HOST,
+    DEFAULT_PROFILE,
+    DEVICE_EVENTS,
+    DOMAIN,
+    PROFILE_CUSTOM,
+    PROFILES,
+)
 
 if TYPE_CHECKING:
     from homeassistant.data_entry_flow import FlowResult
@@ -23,6 +37,14 @@ class KaleidescapeConfigFlow(config_entries.ConfigFlow):
 
     VERSION = 2
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> KaleidescapeOptionsFlow:
+        """Get the options flow for this handler."""
+        return KaleidescapeOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         """Handle the user step."""
         errors = {}
@@ -56,5 +78,65 @@ class KaleidescapeConfigFlow(config_entries.ConfigFlow):
         )
 
 
+class KaleidescapeOptionsFlow(config_entries.OptionsFlow):
+    """Options flow for Kaleidescape integration"""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+        self._options: dict = {}
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        """Handle the options step."""
+        if user_input is not None:
+            self._options.update(user_input)
+            if user_input[CONF_PROFILE] == PROFILE_CUSTOM:
+                return await self.async_step_events()
+            return self.async_create_entry(title="", data=self._options)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PROFILE,
+                        default=options.get(CONF_PROFILE, DEFAULT_PROFILE),
+                    ): vol.In(PROFILES),
+                    vol.Optional(
+                        CONF_BRIDGE_EVENTS,
+                        default=options.get(CONF_BRIDGE_EVENTS, []),
+                    ): cv.multi_select(DEVICE_EVENTS),
+                    vol.Optional(
+                        CONF_BRIDGE_RATE_LIMIT,
+                        default=options.get(
+                            CONF_BRIDGE_RATE_LIMIT, DEFAULT_BRIDGE_RATE_LIMIT
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                }
+            ),
+        )
+
+    async def async_step_events(self, user_input=None) -> FlowResult:
+        """Handle the custom subscription step."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="events",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_EVENTS,
+                        default=self.config_entry.options.get(
+                            CONF_EVENTS, list(DEVICE_EVENTS)
+                        ),
+                    ): cv.multi_select(DEVICE_EVENTS),
+                }
+            ),
+        )
+
+
 class HostnameError(HomeAssistantError):
     """Error to indicate invalid host value."""
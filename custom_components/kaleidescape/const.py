@@ -4,3 +4,59 @@ NAME = "Kaleidescape"
 DOMAIN = "kaleidescape"
 MANAGER = "manager"
 DEFAULT_HOST = "my-kaleidescape.local"
+
+SERVICE_STANDBY_ALL = "standby_all"
+SERVICE_SEND_TO_PLAYERS = "send_to_players"
+
+ATTR_COMMAND = "command"
+ATTR_RESULTS = "results"
+ATTR_TIMEOUT = "timeout"
+
+EVENT_COMMAND_RESULT = "kaleidescape_command_result"
+
+DEFAULT_COMMAND_TIMEOUT = 5
+MAX_CONCURRENT_COMMANDS = 8
+
+DEFAULT_CONNECT_TIMEOUT = 5
+
+SIGNAL_WATCHDOG_UPDATED = "kaleidescape_watchdog_updated"
+
+CONF_BRIDGE_EVENTS = "bridge_events"
+CONF_BRIDGE_RATE_LIMIT = "bridge_rate_limit"
+DEFAULT_BRIDGE_RATE_LIMIT = 1.0
+
+EVENT_KALEIDESCAPE = "kaleidescape_event"
+
+# Device events that can be selected in options, with display names
+DEVICE_EVENTS = {
+    "DEVICE_POWER_STATE": "Power state",
+    "FRIENDLY_NAME": "Friendly name",
+    "PLAY_STATUS": "Play status and position",
+    "MOVIE_LOCATION": "Movie location",
+    "SCREEN_MASK": "Screen mask",
+    "VIDEO_COLOR": "Video color",
+}
+
+SIGNAL_SCREEN_MASK = "kaleidescape_screen_mask"
+
+# Sent when an entry is loaded or unloaded and its devices come or go
+SIGNAL_DEVICES_UPDATED = "kaleidescape_devices_updated"
+
+SIGNAL_STATISTICS_UPDATED = "kaleidescape_statistics_updated"
+
+CONF_REVALIDATE = "revalidate"
+
+CONF_PROFILE = "profile"
+CONF_EVENTS = "events"
+
+PROFILE_TRANSPORT = "transport"
+PROFILE_FULL = "full"
+PROFILE_CUSTOM = "custom"
+DEFAULT_PROFILE = PROFILE_FULL
+
+# Event subscription profiles, with display names
+PROFILES = {
+    PROFILE_TRANSPORT: "Transport only",
+    PROFILE_FULL: "Full automation",
+    PROFILE_CUSTOM: "Custom",
+}
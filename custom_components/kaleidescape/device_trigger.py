@@ -0,0 +1,201 @@
+"""Provides device triggers for Kaleidescape."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from kaleidescape import const as kaleidescape_const
+import voluptuous as vol
+
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import HassJob, callback
+from homeassistant.helpers import device_registry
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_DEVICES_UPDATED
+from .events import device_event_data
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice
+
+    from homeassistant.components.automation import AutomationActionType
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .models import KaleidescapeEntryData
+
+TRIGGER_TURNED_ON = "turned_on"
+TRIGGER_TURNED_OFF = "turned_off"
+TRIGGER_PLAYING = "playing"
+TRIGGER_PAUSED = "paused"
+TRIGGER_STOPPED = "stopped"
+TRIGGER_SCREEN_MASK_CHANGED = "screen_mask_changed"
+TRIGGER_VIDEO_COLOR_CHANGED = "video_color_changed"
+
+# Device event each trigger listens to
+TRIGGER_EVENTS = {
+    TRIGGER_TURNED_ON: kaleidescape_const.DEVICE_POWER_STATE,
+    TRIGGER_TURNED_OFF: kaleidescape_const.DEVICE_POWER_STATE,
+    TRIGGER_PLAYING: kaleidescape_const.PLAY_STATUS,
+    TRIGGER_PAUSED: kaleidescape_const.PLAY_STATUS,
+    TRIGGER_STOPPED: kaleidescape_const.PLAY_STATUS,
+    TRIGGER_SCREEN_MASK_CHANGED: kaleidescape_const.SCREEN_MASK,
+    TRIGGER_VIDEO_COLOR_CHANGED: kaleidescape_const.VIDEO_COLOR,
+}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {vol.Required(CONF_TYPE): vol.In(TRIGGER_EVENTS)}
+)
+
+
+def _trigger_value(device: KaleidescapeDevice, event: str) -> Any:
+    """Returns the device value whose change fires triggers for event."""
+    if event == kaleidescape_const.DEVICE_POWER_STATE:
+        return device.power.state
+    if event == kaleidescape_const.PLAY_STATUS:
+        return device.movie.play_status
+    return tuple(device_event_data(device, event).values())
+
+
+def _trigger_matches(device: KaleidescapeDevice, trigger_type: str) -> bool:
+    """Returns if the current device state matches the trigger type."""
+    if trigger_type == TRIGGER_TURNED_ON:
+        return device.power.state == kaleidescape_const.DEVICE_POWER_STATE_ON
+    if trigger_type == TRIGGER_TURNED_OFF:
+        return device.power.state == kaleidescape_const.DEVICE_POWER_STATE_STANDBY
+    if trigger_type == TRIGGER_PLAYING:
+        return device.movie.play_status == kaleidescape_const.PLAY_STATUS_PLAYING
+    if trigger_type == TRIGGER_PAUSED:
+        return device.movie.play_status == kaleidescape_const.PLAY_STATUS_PAUSED
+    if trigger_type == TRIGGER_STOPPED:
+        return device.movie.play_status == kaleidescape_const.PLAY_STATUS_NONE
+    return True
+
+
+@callback
+def _async_get_serial_numbers(hass: HomeAssistant, device_id: str) -> set[str]:
+    """Returns serial numbers of a device registry entry."""
+    registry = device_registry.async_get(hass)
+    if (entry := registry.async_get(device_id)) is None:
+        return set()
+    return {i[1] for i in entry.identifiers if i[0] == DOMAIN}
+
+
+@callback
+def _async_find_device(
+    hass: HomeAssistant, serial_numbers: set[str]
+) -> KaleidescapeDevice | None:
+    """Returns the device with one of the serial numbers in a loaded entry."""
+    entries: list[KaleidescapeEntryData] = list(hass.data.get(DOMAIN, {}).values())
+    for data in entries:
+        for device in data.devices:
+            if device.serial_number in serial_numbers:
+                return device
+    return None
+
+
+async def async_get_triggers(hass: HomeAssistant, device_id: str) -> list[dict]:
+    """List device triggers for Kaleidescape devices."""
+    serial_numbers = _async_get_serial_numbers(hass, device_id)
+    if not serial_numbers:
+        return []
+
+    device = _async_find_device(hass, serial_numbers)
+    if device is not None and not device.is_movie_player:
+        return []
+
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DEVICE_ID: device_id,
+            CONF_DOMAIN: DOMAIN,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in TRIGGER_EVENTS
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: dict,
+    action: AutomationActionType,
+    automation_info: dict,
+) -> CALLBACK_TYPE:
+    """Attach a trigger straight to the device event stream.
+
+    Triggers fire from the controller dispatcher callback, without waiting for
+    the media player state to be written and a state change to be dispatched.
+    The device is resolved from the device registry, and the trigger connects to
+    it whenever its entry is loaded, so automations attach before the entry is.
+    """
+    trigger_type: str = config[CONF_TYPE]
+    trigger_event = TRIGGER_EVENTS[trigger_type]
+    job = HassJob(action)
+
+    serial_numbers = _async_get_serial_numbers(hass, config[CONF_DEVICE_ID])
+    if not serial_numbers:
+        raise vol.Invalid(f"Device {config[CONF_DEVICE_ID]} not found")
+
+    device: KaleidescapeDevice | None = None
+    signal = None
+    last_value: Any = None
+
+    @callback
+    def _device_event(device_id: str, event: str) -> None:
+        """Fire trigger when the watched value changes to a matching state."""
+        nonlocal last_value
+        if (
+            device is None
+            or event != trigger_event
+            or not device.has_device_id(device_id)
+        ):
+            return
+
+        value = _trigger_value(device, event)
+        if value == last_value:
+            return
+        last_value = value
+
+        if not _trigger_matches(device, trigger_type):
+            return
+
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **config,
+                    **device_event_data(device, event),
+                    "description": f"Kaleidescape {trigger_type.replace('_', ' ')}",
+                }
+            },
+        )
+
+    @callback
+    def _async_update_device() -> None:
+        """Connect to the device of a loaded entry, or disconnect when it goes."""
+        nonlocal device, signal, last_value
+        found = _async_find_device(hass, serial_numbers)
+        if found is device:
+            return
+        if signal is not None:
+            signal.disconnect()
+            signal = None
+        device = found
+        if device is not None:
+            last_value = _trigger_value(device, trigger_event)
+            signal = device.dispatcher.connect(
+                kaleidescape_const.SIGNAL_DEVICE_EVENT, _device_event
+            )
+
+    remove_listener = async_dispatcher_connect(
+        hass, SIGNAL_DEVICES_UPDATED, _async_update_device
+    )
+    _async_update_device()
+
+    @callback
+    def _async_detach() -> None:
+        remove_listener()
+        if signal is not None:
+            signal.disconnect()
+
+    return _async_detach
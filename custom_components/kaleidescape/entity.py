@@ -0,0 +1,40 @@
+"""Base entity for the Kaleidescape integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.entity import DeviceInfo, Entity
+
+from .const import DOMAIN as KALEIDESCAPE_DOMAIN, NAME as KALEIDESCAPE_NAME
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice
+
+
+class KaleidescapeEntity(Entity):
+    """Defines a base Kaleidescape entity."""
+
+    def __init__(self, device: KaleidescapeDevice) -> None:
+        """Initialize entity."""
+        self._device: KaleidescapeDevice = device
+        # Static, only read when the entity is registered
+        self._attr_device_info = DeviceInfo(
+            identifiers={(KALEIDESCAPE_DOMAIN, device.serial_number)},
+            name=f"{device.system.friendly_name} {KALEIDESCAPE_NAME}",
+            model=device.system.type,
+            manufacturer=KALEIDESCAPE_NAME,
+            sw_version=f"{device.system.kos_version}",
+            suggested_area="Theater",
+            configuration_url=f"http://{device.connection.ip_address}",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Returns if device is available."""
+        return self._device.is_connected
+
+    @property
+    def should_poll(self) -> bool:
+        """No polling needed for this device."""
+        return False
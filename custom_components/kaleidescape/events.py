@@ -0,0 +1,51 @@
+"""Device event payloads for the Kaleidescape integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from kaleidescape import const as kaleidescape_const
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice
+
+
+def device_event_data(device: KaleidescapeDevice, event: str) -> dict[str, Any]:
+    """Returns the device state relevant to a device event."""
+    if event == kaleidescape_const.DEVICE_POWER_STATE:
+        return {"power_state": device.power.state}
+    if event == kaleidescape_const.FRIENDLY_NAME:
+        return {"friendly_name": device.system.friendly_name}
+    if event == kaleidescape_const.PLAY_STATUS:
+        return {
+            "play_status": device.movie.play_status,
+            "media_content_id": device.movie.handle,
+            "title_location": device.movie.title_location,
+            "title_length": device.movie.title_length,
+        }
+    if event == kaleidescape_const.MOVIE_LOCATION:
+        return {"media_location": device.automation.movie_location}
+    if event == kaleidescape_const.SCREEN_MASK:
+        return {
+            "screen_mask_ratio": device.automation.screen_mask_ratio,
+            "screen_mask_top_trim_rel": device.automation.screen_mask_top_trim_rel,
+            "screen_mask_bottom_trim_rel": (
+                device.automation.screen_mask_bottom_trim_rel
+            ),
+            "screen_mask_conservative_ratio": (
+                device.automation.screen_mask_conservative_ratio
+            ),
+            "screen_mask_top_mask_abs": device.automation.screen_mask_top_mask_abs,
+            "screen_mask_bottom_mask_abs": (
+                device.automation.screen_mask_bottom_mask_abs
+            ),
+            "cinemascape_mask": device.automation.cinemascape_mask,
+        }
+    if event == kaleidescape_const.VIDEO_COLOR:
+        return {
+            "video_color_eotf": device.automation.video_color_eotf,
+            "video_color_space": device.automation.video_color_space,
+            "video_color_depth": device.automation.video_color_depth,
+            "video_color_sampling": device.automation.video_color_sampling,
+        }
+    return {}
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from kaleidescape import const as kaleidescape_const
 
@@ -18,17 +18,29 @@ from homeassistant.components.media_player.const import (
 )
 from homeassistant.const import STATE_IDLE, STATE_OFF, STATE_PAUSED, STATE_PLAYING
 from homeassistant.core import callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.util import utcnow
 
 from .const import DOMAIN as KALEIDESCAPE_DOMAIN, NAME as KALEIDESCAPE_NAME
+from .entity import KaleidescapeEntity
+from .scheduler import (
+    COMMAND_ENTER_STANDBY,
+    COMMAND_LEAVE_STANDBY,
+    COMMAND_PAUSE,
+    COMMAND_PLAY,
+    COMMAND_STOP,
+)
 
 if TYPE_CHECKING:
-    from kaleidescape import Kaleidescape, Device as KaleidescapeDevice
+    from kaleidescape import Device as KaleidescapeDevice, Dispatcher
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
+    from .artwork import Artwork, ArtworkCache
+    from .models import KaleidescapeEntryData
+    from .scheduler import CommandScheduler
+    from .subscription import SubscriptionDispatcher
+
 SUPPORTED_FEATURES = (
     SUPPORT_TURN_ON | SUPPORT_TURN_OFF | SUPPORT_PLAY | SUPPORT_PAUSE | SUPPORT_STOP
 )
@@ -62,31 +74,148 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ):
     """Set up the platform from a config entry."""
-    controller: Kaleidescape = hass.data[KALEIDESCAPE_DOMAIN][entry.entry_id]
+    data: KaleidescapeEntryData = hass.data[KALEIDESCAPE_DOMAIN][entry.entry_id]
     entities = [
-        KaleidescapeMediaPlayer(p)
-        for p in await controller.get_devices()
+        KaleidescapeMediaPlayer(
+            p,
+            data.dispatcher,
+            data.schedulers[p.serial_number],
+            data.artwork,
+        )
+        for p in await data.controller.get_devices()
         if p.is_movie_player
     ]
     async_add_entities(entities, True)
 
 
-class KaleidescapeMediaPlayer(MediaPlayerEntity):
+class PlayerSnapshot:
+    """Dynamic state of a player, read by every state write.
+
+    Each part is refreshed only by the device event that changes it, so writes
+    are plain attribute lookups.
+    """
+
+    __slots__ = (
+        "state",
+        "content_id",
+        "content_type",
+        "duration",
+        "position",
+        "position_updated_at",
+        "title",
+        "image_url",
+        "attributes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize snapshot."""
+        self.state = STATE_OFF
+        self.content_id: str | None = None
+        self.content_type: str | None = None
+        self.duration: int | None = None
+        self.position: int | None = None
+        self.position_updated_at: datetime | None = None
+        self.title: str | None = None
+        self.image_url: str | None = None
+        self.attributes: dict[str, Any] = {"media_image_palette": None}
+
+    def update_state(self, device: KaleidescapeDevice) -> None:
+        """Refresh the player state."""
+        if device.power.state == kaleidescape_const.DEVICE_POWER_STATE_STANDBY:
+            self.state = STATE_OFF
+        elif device.movie.play_status in KALEIDESCAPE_PLAYING_STATES:
+            self.state = STATE_PLAYING
+        elif device.movie.play_status in KALEIDESCAPE_PAUSED_STATES:
+            self.state = STATE_PAUSED
+        else:
+            self.state = STATE_IDLE
+
+    def update_movie(self, device: KaleidescapeDevice, artwork: Artwork | None) -> None:
+        """Refresh the current title and its position."""
+        movie = device.movie
+        self.content_id = movie.handle or None
+        self.content_type = movie.media_type or None
+        self.duration = movie.title_length or None
+        self.position = movie.title_location or None
+        self.position_updated_at = (
+            utcnow() if movie.play_status in KALEIDESCAPE_PLAYING_STATES else None
+        )
+        self.title = movie.title
+        self.image_url = movie.cover
+        self.update_artwork(artwork)
+
+    def update_artwork(self, artwork: Artwork | None) -> None:
+        """Refresh the cover art palette."""
+        self.attributes["media_image_palette"] = (
+            list(artwork.palette) if artwork else None
+        )
+
+    def update_location(self, device: KaleidescapeDevice) -> None:
+        """Refresh the movie location."""
+        self.attributes["media_location"] = device.automation.movie_location
+
+    def update_video(self, device: KaleidescapeDevice) -> None:
+        """Refresh the video mode and color."""
+        automation = device.automation
+        self.attributes.update(
+            video_mode=automation.video_mode,
+            video_color_eotf=automation.video_color_eotf,
+            video_color_space=automation.video_color_space,
+            video_color_depth=automation.video_color_depth,
+            video_color_sampling=automation.video_color_sampling,
+        )
+
+    def update_mask(self, device: KaleidescapeDevice) -> None:
+        """Refresh the screen mask and CinemaScape settings."""
+        automation = device.automation
+        self.attributes.update(
+            screen_mask_ratio=automation.screen_mask_ratio,
+            screen_mask_top_trim_rel=automation.screen_mask_top_trim_rel,
+            screen_mask_bottom_trim_rel=automation.screen_mask_bottom_trim_rel,
+            screen_mask_conservative_ratio=(
+                automation.screen_mask_conservative_ratio
+            ),
+            screen_mask_top_mask_abs=automation.screen_mask_top_mask_abs,
+            screen_mask_bottom_mask_abs=automation.screen_mask_bottom_mask_abs,
+            cinemascape_mask=automation.cinemascape_mask,
+            cinemascape_mode=automation.cinemascape_mode,
+        )
+
+
+class KaleidescapeMediaPlayer(KaleidescapeEntity, MediaPlayerEntity):
     """Representation of a Kaleidescape device."""
 
-    def __init__(self, device) -> None:
+    _attr_supported_features = SUPPORTED_FEATURES
+
+    def __init__(
+        self,
+        device: KaleidescapeDevice,
+        dispatcher: Dispatcher | SubscriptionDispatcher,
+        scheduler: CommandScheduler,
+        artwork: ArtworkCache,
+    ) -> None:
         """Initialize media player."""
-        self._device: KaleidescapeDevice = device
+        super().__init__(device)
+        self._dispatcher = dispatcher
+        self._attr_unique_id = device.serial_number
+        self._attr_name = f"{device.system.friendly_name} {KALEIDESCAPE_NAME}"
+        self._artwork = artwork
+        self._artwork_handle: str | None = None
+        self._scheduler = scheduler
+        self._snapshot = PlayerSnapshot()
 
     async def async_added_to_hass(self) -> None:
+        self._async_refresh()
+
         # Handle update signals coming from Kaleidescape controller
         @callback
         def _controller_update(event: str) -> None:
             """Handle controller state changes."""
+            self._async_refresh()
             self.async_write_ha_state()
 
         self.async_on_remove(
-            self._device.dispatcher.connect(
+            self._dispatcher.connect(
                 kaleidescape_const.SIGNAL_CONTROLLER_EVENT, _controller_update
             ).disconnect
         )
@@ -96,145 +225,134 @@ class KaleidescapeMediaPlayer(MediaPlayerEntity):
         def _device_update(device_id: str, event: str) -> None:
             """Handle device state changes."""
             if self._device.has_device_id(device_id):
+                self._async_refresh(event)
                 if event in KALEIDESCAPE_DEVICE_EVENTS:
                     self.async_write_ha_state()
 
         self.async_on_remove(
-            self._device.dispatcher.connect(
+            self._dispatcher.connect(
                 kaleidescape_const.SIGNAL_DEVICE_EVENT, _device_update
             ).disconnect
         )
 
+    @callback
+    def _async_refresh(self, event: str | None = None) -> None:
+        """Refresh the parts of the snapshot changed by a device event.
+
+        Without an event, when added and on controller events, all of it is
+        refreshed. Device events the snapshot does not map are ignored.
+        """
+        device = self._device
+        snapshot = self._snapshot
+        if event is None:
+            self._attr_name = f"{device.system.friendly_name} {KALEIDESCAPE_NAME}"
+            self._async_update_movie()
+            snapshot.update_location(device)
+            snapshot.update_video(device)
+            snapshot.update_mask(device)
+        elif event == kaleidescape_const.DEVICE_POWER_STATE:
+            snapshot.update_state(device)
+        elif event == kaleidescape_const.PLAY_STATUS:
+            self._async_update_movie()
+        elif event == kaleidescape_const.MOVIE_LOCATION:
+            snapshot.update_location(device)
+        elif event == kaleidescape_const.VIDEO_COLOR:
+            snapshot.update_video(device)
+        elif event in (
+            kaleidescape_const.SCREEN_MASK,
+            kaleidescape_const.CINEMASCAPE_MASK,
+        ):
+            snapshot.update_mask(device)
+        elif event == kaleidescape_const.FRIENDLY_NAME:
+            self._attr_name = f"{device.system.friendly_name} {KALEIDESCAPE_NAME}"
+
+    @callback
+    def _async_update_movie(self) -> None:
+        """Refresh the current title and process its cover art."""
+        movie = self._device.movie
+        self._snapshot.update_state(self._device)
+        self._snapshot.update_movie(self._device, self._artwork.get(movie.handle))
+        if not movie.handle or not movie.cover or movie.handle == self._artwork_handle:
+            return
+        self._artwork_handle = movie.handle
+        self.hass.async_create_task(
+            self._async_update_artwork(movie.handle, movie.cover_hires or movie.cover)
+        )
+
+    async def _async_update_artwork(self, handle: str, url: str) -> None:
+        """Process cover art of a title in the background."""
+        artwork = await self._artwork.async_get(handle, url)
+        if self._device.movie.handle == handle:
+            self._snapshot.update_artwork(artwork)
+            self.async_write_ha_state()
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Returns thumbnail of current playing media."""
+        if artwork := self._artwork.get(self._device.movie.handle):
+            return artwork.thumbnail, artwork.content_type
+        return await super().async_get_media_image()
+
     async def async_turn_on(self) -> None:
         """Send leave standby command."""
-        await self._device.leave_standby()
+        await self._scheduler.async_send(COMMAND_LEAVE_STANDBY)
 
     async def async_turn_off(self) -> None:
         """Send enter standby command."""
-        await self._device.enter_standby()
+        await self._scheduler.async_send(COMMAND_ENTER_STANDBY)
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
-        await self._device.pause()
+        await self._scheduler.async_send(COMMAND_PAUSE)
 
     async def async_media_play(self) -> None:
         """Send play command."""
-        await self._device.play()
+        await self._scheduler.async_send(COMMAND_PLAY)
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        await self._device.stop()
-
-    @property
-    def available(self) -> bool:
-        """Returns if device is available."""
-        return self._device.is_connected
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Returns device specific attributes."""
-        return DeviceInfo(
-            identifiers={(KALEIDESCAPE_DOMAIN, self._device.serial_number)},
-            name=self.name,
-            model=self._device.system.type,
-            manufacturer=KALEIDESCAPE_NAME,
-            sw_version=f"{self._device.system.kos_version}",
-            suggested_area="Theater",
-            configuration_url=f"http://{self._device.connection.ip_address}",
-        )
+        await self._scheduler.async_send(COMMAND_STOP)
 
     @property
     def extra_state_attributes(self) -> dict:
         """Returns additional attributes about the state."""
-        return {
-            "media_location": self._device.automation.movie_location,
-            "video_mode": self._device.automation.video_mode,
-            "video_color_eotf": self._device.automation.video_color_eotf,
-            "video_color_space": self._device.automation.video_color_space,
-            "video_color_depth": self._device.automation.video_color_depth,
-            "video_color_sampling": self._device.automation.video_color_sampling,
-            "screen_mask_ratio": self._device.automation.screen_mask_ratio,
-            "screen_mask_top_trim_rel": self._device.automation.screen_mask_top_trim_rel,
-            "screen_mask_bottom_trim_rel": self._device.automation.screen_mask_bottom_trim_rel,
-            "screen_mask_conservative_ratio": self._device.automation.screen_mask_conservative_ratio,
-            "screen_mask_top_mask_abs": self._device.automation.screen_mask_top_mask_abs,
-            "screen_mask_bottom_mask_abs": self._device.automation.screen_mask_bottom_mask_abs,
-            "cinemascape_mask": self._device.automation.cinemascape_mask,
-            "cinemascape_mode": self._device.automation.cinemascape_mode,
-        }
-
-    @property
-    def name(self) -> str:
-        """Return the name of the device."""
-        return f"{self._device.system.friendly_name} {KALEIDESCAPE_NAME}"
-
-    @property
-    def should_poll(self) -> bool:
-        """No polling needed for this device."""
-        return False
+        return self._snapshot.attributes
 
     @property
     def state(self) -> str:
         """State of device."""
-        if self._device.power.state == kaleidescape_const.DEVICE_POWER_STATE_STANDBY:
-            return STATE_OFF
-        if self._device.movie.play_status in KALEIDESCAPE_PLAYING_STATES:
-            return STATE_PLAYING
-        if self._device.movie.play_status in KALEIDESCAPE_PAUSED_STATES:
-            return STATE_PAUSED
-        return STATE_IDLE
-
-    @property
-    def supported_features(self) -> int:
-        """Flag media device features that are supported."""
-        return SUPPORTED_FEATURES
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for device."""
-        return self._device.serial_number
+        return self._snapshot.state
 
     @property
     def media_content_id(self) -> str | None:
         """Content ID of current playing media."""
-        if self._device.movie.handle:
-            return self._device.movie.handle
-        return None
+        return self._snapshot.content_id
 
     @property
     def media_content_type(self) -> str | None:
         """Content type of current playing media."""
-        if self._device.movie.media_type:
-            return self._device.movie.media_type
-        return None
+        return self._snapshot.content_type
 
     @property
     def media_duration(self) -> int | None:
         """Duration of current playing media in seconds."""
-        if self._device.movie.title_length:
-            return self._device.movie.title_length
-        return None
+        return self._snapshot.duration
 
     @property
     def media_position(self) -> int | None:
         """Position of current playing media in seconds."""
-        if self._device.movie.title_location:
-            return self._device.movie.title_location
-        return None
+        return self._snapshot.position
 
     @property
     def media_position_updated_at(self) -> datetime | None:
         """When was the position of the current playing media valid."""
-        if self._device.movie.play_status in KALEIDESCAPE_PLAYING_STATES:
-            return utcnow()
-        return None
+        return self._snapshot.position_updated_at
 
     @property
-    def media_image_url(self) -> str:
+    def media_image_url(self) -> str | None:
         """Image url of current playing media."""
-        return self._device.movie.cover
+        return self._snapshot.image_url
 
     @property
-    def media_title(self) -> str:
+    def media_title(self) -> str | None:
         """Title of current playing media."""
-        return self._device.movie.title
+        return self._snapshot.title
@@ -0,0 +1,32 @@
+"""Models for the Kaleidescape integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice, Dispatcher, Kaleidescape
+
+    from .artwork import ArtworkCache
+    from .bridge import EventBridge
+    from .scheduler import CommandScheduler
+    from .subscription import SubscriptionDispatcher
+    from .usage import WatchStatistics
+    from .watchdog import ConnectionWatchdog
+
+
+@dataclass
+class KaleidescapeEntryData:
+    """Runtime data for a Kaleidescape config entry."""
+
+    controller: Kaleidescape
+    devices: list[KaleidescapeDevice]
+    # Delivers the device events the entry subscribes to
+    dispatcher: Dispatcher | SubscriptionDispatcher
+    watchdog: ConnectionWatchdog
+    # Command scheduler of each movie player, keyed by serial number
+    schedulers: dict[str, CommandScheduler]
+    artwork: ArtworkCache
+    statistics: WatchStatistics
+    bridge: EventBridge | None = None
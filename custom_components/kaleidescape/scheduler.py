@@ -0,0 +1,170 @@
+"""Command scheduling for Kaleidescape devices."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from typing import TYPE_CHECKING
+
+from kaleidescape import const as kaleidescape_const
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice
+
+COMMAND_LEAVE_STANDBY = "leave_standby"
+COMMAND_ENTER_STANDBY = "enter_standby"
+COMMAND_PLAY = "play"
+COMMAND_PAUSE = "pause"
+COMMAND_STOP = "stop"
+
+SLOT_POWER = "power"
+SLOT_TRANSPORT = "transport"
+
+COMMAND_SLOTS = {
+    COMMAND_LEAVE_STANDBY: SLOT_POWER,
+    COMMAND_ENTER_STANDBY: SLOT_POWER,
+    COMMAND_PLAY: SLOT_TRANSPORT,
+    COMMAND_PAUSE: SLOT_TRANSPORT,
+    COMMAND_STOP: SLOT_TRANSPORT,
+}
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_command_satisfied(device: KaleidescapeDevice, command: str) -> bool:
+    """Returns if the device is already in the state the command would produce."""
+    if command == COMMAND_LEAVE_STANDBY:
+        return device.power.state == kaleidescape_const.DEVICE_POWER_STATE_ON
+    if command == COMMAND_ENTER_STANDBY:
+        return device.power.state == kaleidescape_const.DEVICE_POWER_STATE_STANDBY
+    if command == COMMAND_PLAY:
+        return device.movie.play_status == kaleidescape_const.PLAY_STATUS_PLAYING
+    if command == COMMAND_PAUSE:
+        return device.movie.play_status == kaleidescape_const.PLAY_STATUS_PAUSED
+    # Stop also leaves menus and intermissions, it is always sent
+    return False
+
+
+def is_command_confirmed(device: KaleidescapeDevice, command: str) -> bool:
+    """Returns if device state reflects a command that was sent."""
+    if command == COMMAND_STOP:
+        return device.movie.play_status == kaleidescape_const.PLAY_STATUS_NONE
+    return is_command_satisfied(device, command)
+
+
+class _PendingCommand:
+    """Command waiting for its slot to become free."""
+
+    __slots__ = ("command", "future")
+
+    def __init__(self, command: str, future: asyncio.Future) -> None:
+        """Initialize pending command."""
+        self.command = command
+        self.future = future
+
+
+class CommandScheduler:
+    """Sends idempotent commands to a device with last-writer-wins semantics.
+
+    Commands share a slot (power or transport). Only one command per slot is in
+    flight at a time, and at most one more is queued behind it. A command arriving
+    while another is queued replaces it, so a burst of calls collapses into the
+    in-flight command plus the most recent request. Commands the device state
+    already satisfies are dropped, but only once the device has reported the
+    state produced by the last command sent for the slot. State changes arrive
+    as events after commands are acknowledged, and until then the state is
+    stale. If get_timeout is given, each command is bounded
+    by the timeout it returns.
+
+    One scheduler is shared by everything that commands the device, so entity
+    and group service commands are serialized and collapsed together.
+    """
+
+    def __init__(
+        self,
+        device: KaleidescapeDevice,
+        get_timeout: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize scheduler."""
+        self.device = device
+        self._get_timeout = get_timeout
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._pending: dict[str, _PendingCommand] = {}
+        self._unconfirmed: dict[str, str] = {}
+        self.sent = 0
+        self.suppressed = 0
+
+    async def async_send(self, command: str, timeout: float | None = None) -> bool:
+        """Schedule command to be sent to the device.
+
+        Returns if a command was sent, False if the device state already satisfied
+        it. Superseded callers get the result of the command that replaced theirs.
+        """
+        slot = COMMAND_SLOTS[command]
+        lock = self._locks.setdefault(slot, asyncio.Lock())
+
+        pending = self._pending.get(slot)
+        if pending is not None:
+            # Last writer wins, the queued command is replaced by this one
+            self._suppress(pending.command, f"superseded by {command}")
+            pending.command = command
+            return await asyncio.shield(pending.future)
+
+        # Device state is only final when no command for the slot is in flight
+        if not lock.locked() and self._is_satisfied(slot, command):
+            self._suppress(command, "already satisfied")
+            return False
+
+        pending = _PendingCommand(command, asyncio.get_running_loop().create_future())
+        self._pending[slot] = pending
+
+        sent = False
+        try:
+            async with lock:
+                del self._pending[slot]
+                # State may have changed while waiting on the in-flight command
+                if self._is_satisfied(slot, pending.command):
+                    self._suppress(pending.command, "already satisfied")
+                else:
+                    send = getattr(self.device, pending.command)()
+                    if timeout is None and self._get_timeout:
+                        timeout = self._get_timeout()
+                    if timeout is not None:
+                        send = asyncio.wait_for(send, timeout)
+                    self._unconfirmed[slot] = pending.command
+                    await send
+                    self.sent += 1
+                    sent = True
+        except BaseException as err:
+            if self._pending.get(slot) is pending:
+                del self._pending[slot]
+            if isinstance(err, asyncio.CancelledError):
+                pending.future.cancel()
+            else:
+                pending.future.set_exception(err)
+                # Mark retrieved, callers that were superseded may not be waiting
+                pending.future.exception()
+            raise
+
+        pending.future.set_result(sent)
+        return sent
+
+    def _is_satisfied(self, slot: str, command: str) -> bool:
+        """Returns if command can be dropped based on confirmed device state."""
+        if (last := self._unconfirmed.get(slot)) is not None:
+            if not is_command_confirmed(self.device, last):
+                return False
+            del self._unconfirmed[slot]
+        return is_command_satisfied(self.device, command)
+
+    def _suppress(self, command: str, reason: str) -> None:
+        """Record a command that was not sent."""
+        self.suppressed += 1
+        _LOGGER.debug(
+            "Suppressed %s command for %s (%s), %s suppressed so far",
+            command,
+            self.device.serial_number,
+            reason,
+            self.suppressed,
+        )
@@ -0,0 +1,91 @@
+"""Screen mask fast path for masking and lens memory integrations."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from kaleidescape import const as kaleidescape_const
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_SCREEN_MASK
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice, Dispatcher
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+SCREEN_MASK_EVENTS = frozenset(
+    [kaleidescape_const.SCREEN_MASK, kaleidescape_const.CINEMASCAPE_MASK]
+)
+
+
+class ScreenMaskEvent(NamedTuple):
+    """Screen mask of a player, sent with SIGNAL_SCREEN_MASK."""
+
+    serial_number: str
+    ratio: str
+    top_trim_rel: int
+    bottom_trim_rel: int
+    conservative_ratio: str
+    top_mask_abs: int
+    bottom_mask_abs: int
+    cinemascape_mask: int
+    # Monotonic time the device event was received
+    received: float
+
+    @classmethod
+    def from_device(
+        cls, device: KaleidescapeDevice, received: float
+    ) -> ScreenMaskEvent:
+        """Returns event with the current mask of the device."""
+        automation = device.automation
+        return cls(
+            device.serial_number,
+            automation.screen_mask_ratio,
+            automation.screen_mask_top_trim_rel,
+            automation.screen_mask_bottom_trim_rel,
+            automation.screen_mask_conservative_ratio,
+            automation.screen_mask_top_mask_abs,
+            automation.screen_mask_bottom_mask_abs,
+            automation.cinemascape_mask,
+            received,
+        )
+
+
+@callback
+def async_setup_screen_mask_signal(
+    hass: HomeAssistant, dispatcher: Dispatcher, devices: list[KaleidescapeDevice]
+) -> CALLBACK_TYPE:
+    """Send SIGNAL_SCREEN_MASK straight from the device event callback.
+
+    Subscribers receive a ScreenMaskEvent without waiting for a media player state
+    write. Events are only sent when the mask actually changed.
+    """
+    last_masks: dict[str, tuple] = {}
+
+    @callback
+    def _device_event(device_id: str, event: str) -> None:
+        if event not in SCREEN_MASK_EVENTS:
+            return
+
+        received = time.monotonic()
+        for device in devices:
+            if device.has_device_id(device_id):
+                break
+        else:
+            return
+
+        mask_event = ScreenMaskEvent.from_device(device, received)
+        mask = mask_event[1:-1]
+        if last_masks.get(device.serial_number) == mask:
+            return
+        last_masks[device.serial_number] = mask
+
+        async_dispatcher_send(hass, SIGNAL_SCREEN_MASK, mask_event)
+
+    return dispatcher.connect(
+        kaleidescape_const.SIGNAL_DEVICE_EVENT, _device_event
+    ).disconnect
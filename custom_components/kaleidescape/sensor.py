@@ -0,0 +1,224 @@
+"""Kaleidescape Sensors."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    STATE_CLASS_MEASUREMENT,
+    STATE_CLASS_TOTAL_INCREASING,
+    SensorEntity,
+    SensorEntityDescription,
+)
+from homeassistant.const import (
+    ENTITY_CATEGORY_DIAGNOSTIC,
+    TIME_HOURS,
+    TIME_MILLISECONDS,
+    TIME_MINUTES,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN as KALEIDESCAPE_DOMAIN, NAME as KALEIDESCAPE_NAME
+from .entity import KaleidescapeEntity
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from homeassistant.helpers.typing import StateType
+
+    from .models import KaleidescapeEntryData
+    from .usage import UsageCounters, WatchStatistics
+    from .watchdog import ConnectionWatchdog
+
+
+@dataclass
+class KaleidescapeStatisticRequiredKeysMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[UsageCounters], StateType]
+
+
+@dataclass
+class KaleidescapeStatisticEntityDescription(
+    SensorEntityDescription, KaleidescapeStatisticRequiredKeysMixin
+):
+    """Describes Kaleidescape usage statistic sensor entity."""
+
+
+def _average_session_minutes(counters: UsageCounters) -> float | None:
+    if (seconds := counters.average_session_seconds) is None:
+        return None
+    return round(seconds / 60, 1)
+
+
+STATISTIC_SENSORS: tuple[KaleidescapeStatisticEntityDescription, ...] = (
+    KaleidescapeStatisticEntityDescription(
+        key="hours_played",
+        name="Hours Played",
+        icon="mdi:clock-outline",
+        native_unit_of_measurement=TIME_HOURS,
+        state_class=STATE_CLASS_TOTAL_INCREASING,
+        value_fn=lambda counters: round(counters.played_seconds / 3600, 2),
+    ),
+    KaleidescapeStatisticEntityDescription(
+        key="titles_started",
+        name="Titles Started",
+        icon="mdi:movie-open",
+        state_class=STATE_CLASS_TOTAL_INCREASING,
+        value_fn=lambda counters: counters.started,
+    ),
+    KaleidescapeStatisticEntityDescription(
+        key="titles_finished",
+        name="Titles Finished",
+        icon="mdi:movie-check",
+        state_class=STATE_CLASS_TOTAL_INCREASING,
+        value_fn=lambda counters: counters.finished,
+    ),
+    KaleidescapeStatisticEntityDescription(
+        key="average_session_length",
+        name="Average Session Length",
+        icon="mdi:timer-sand",
+        native_unit_of_measurement=TIME_MINUTES,
+        state_class=STATE_CLASS_MEASUREMENT,
+        value_fn=_average_session_minutes,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities
+):
+    """Set up the platform from a config entry."""
+    data: KaleidescapeEntryData = hass.data[KALEIDESCAPE_DOMAIN][entry.entry_id]
+    entities: list[SensorEntity] = []
+    # The watchdog measures the system connection, held by the local device
+    if (local_device := await data.controller.get_local_device()) is not None:
+        entities.append(KaleidescapeRoundTripTimeSensor(local_device, data.watchdog))
+    for device in await data.controller.get_devices():
+        if not device.is_movie_player:
+            continue
+        entities.extend(
+            KaleidescapeStatisticSensor(device, data.statistics, description)
+            for description in STATISTIC_SENSORS
+        )
+    async_add_entities(entities)
+
+
+class KaleidescapeRoundTripTimeSensor(KaleidescapeEntity, SensorEntity):
+    """Round trip time of the connection to the Kaleidescape system."""
+
+    _attr_entity_category = ENTITY_CATEGORY_DIAGNOSTIC
+    _attr_native_unit_of_measurement = TIME_MILLISECONDS
+    _attr_state_class = STATE_CLASS_MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self, device: KaleidescapeDevice, watchdog: ConnectionWatchdog
+    ) -> None:
+        """Initialize sensor."""
+        super().__init__(device)
+        self._watchdog = watchdog
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._watchdog.signal, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return (
+            f"{self._device.system.friendly_name} {KALEIDESCAPE_NAME} Round Trip Time"
+        )
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID for sensor."""
+        return f"{self._device.serial_number}-rtt"
+
+    @property
+    def native_value(self) -> float | None:
+        """Smoothed round trip time in milliseconds."""
+        if self._watchdog.srtt is None:
+            return None
+        return round(self._watchdog.srtt * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Returns additional attributes about the connection."""
+        return {
+            "last_rtt": (
+                round(self._watchdog.last_rtt * 1000, 1)
+                if self._watchdog.last_rtt is not None
+                else None
+            ),
+            "command_timeout": round(self._watchdog.command_timeout, 2),
+            "connect_timeout": round(self._watchdog.connect_timeout, 2),
+            "failed_probes": self._watchdog.failed_probes,
+            "reconnects": self._watchdog.reconnects,
+        }
+
+
+class KaleidescapeStatisticSensor(KaleidescapeEntity, SensorEntity):
+    """Usage statistic of a Kaleidescape player."""
+
+    entity_description: KaleidescapeStatisticEntityDescription
+
+    def __init__(
+        self,
+        device: KaleidescapeDevice,
+        statistics: WatchStatistics,
+        description: KaleidescapeStatisticEntityDescription,
+    ) -> None:
+        """Initialize sensor."""
+        super().__init__(device)
+        self._statistics = statistics
+        self.entity_description = description
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self._statistics.signal(self._device.serial_number),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return (
+            f"{self._device.system.friendly_name} {KALEIDESCAPE_NAME} "
+            f"{self.entity_description.name}"
+        )
+
+    @property
+    def unique_id(self) -> str:
+        """Return a unique ID for sensor."""
+        return f"{self._device.serial_number}-{self.entity_description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Value of the statistic for the player."""
+        return self.entity_description.value_fn(
+            self._statistics.player(self._device.serial_number)
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Returns the statistic for the title currently playing."""
+        handle = self._statistics.current_handle(self._device.serial_number)
+        return {
+            "current_title": (
+                self.entity_description.value_fn(self._statistics.title(handle))
+                if handle
+                else None
+            )
+        }
@@ -0,0 +1,164 @@
+"""Services for the Kaleidescape integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv, entity_registry
+
+from .const import (
+    ATTR_COMMAND,
+    ATTR_RESULTS,
+    ATTR_TIMEOUT,
+    DOMAIN,
+    EVENT_COMMAND_RESULT,
+    MAX_CONCURRENT_COMMANDS,
+    SERVICE_SEND_TO_PLAYERS,
+    SERVICE_STANDBY_ALL,
+)
+from .scheduler import (
+    COMMAND_ENTER_STANDBY,
+    COMMAND_LEAVE_STANDBY,
+    COMMAND_PAUSE,
+    COMMAND_PLAY,
+    COMMAND_STOP,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall
+
+    from .models import KaleidescapeEntryData
+    from .scheduler import CommandScheduler
+
+PLAYER_COMMANDS = [
+    COMMAND_LEAVE_STANDBY,
+    COMMAND_ENTER_STANDBY,
+    COMMAND_PLAY,
+    COMMAND_PAUSE,
+    COMMAND_STOP,
+]
+
+RESULT_OK = "ok"
+RESULT_SKIPPED = "skipped"
+RESULT_TIMEOUT = "timeout"
+RESULT_ERROR = "error"
+
+TIMEOUT_SCHEMA = vol.All(vol.Coerce(float), vol.Range(min=0.1, max=60))
+
+STANDBY_ALL_SCHEMA = vol.Schema({vol.Optional(ATTR_TIMEOUT): TIMEOUT_SCHEMA})
+
+SEND_TO_PLAYERS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_COMMAND): vol.In(PLAYER_COMMANDS),
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_TIMEOUT): TIMEOUT_SCHEMA,
+    }
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration level services."""
+    if hass.services.has_service(DOMAIN, SERVICE_STANDBY_ALL):
+        return
+
+    async def standby_all(call: ServiceCall) -> None:
+        """Put every movie player into standby."""
+        players = _async_get_players(hass, timeout=call.data.get(ATTR_TIMEOUT))
+        await async_send_to_players(hass, players, COMMAND_ENTER_STANDBY)
+
+    async def send_to_players(call: ServiceCall) -> None:
+        """Send a command to selected movie players, or all if none selected."""
+        players = _async_get_players(
+            hass, call.data.get(ATTR_ENTITY_ID), call.data.get(ATTR_TIMEOUT)
+        )
+        await async_send_to_players(hass, players, call.data[ATTR_COMMAND])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_STANDBY_ALL, standby_all, schema=STANDBY_ALL_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SEND_TO_PLAYERS, send_to_players, schema=SEND_TO_PLAYERS_SCHEMA
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove integration level services."""
+    hass.services.async_remove(DOMAIN, SERVICE_STANDBY_ALL)
+    hass.services.async_remove(DOMAIN, SERVICE_SEND_TO_PLAYERS)
+
+
+async def async_send_to_players(
+    hass: HomeAssistant,
+    players: list[tuple[CommandScheduler, float | None]],
+    command: str,
+) -> dict[str, str]:
+    """Send command to players concurrently and fire an aggregated result event.
+
+    Commands go through the command scheduler of each player, paired with the
+    timeout to apply, or None for the adaptive timeout of its system.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+
+    async def _send(scheduler: CommandScheduler, timeout: float | None) -> str:
+        serial_number = scheduler.device.serial_number
+        async with semaphore:
+            try:
+                sent = await scheduler.async_send(command, timeout)
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Command %s to %s timed out", command, serial_number)
+                return RESULT_TIMEOUT
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning(
+                    "Command %s to %s failed: %s", command, serial_number, err
+                )
+                return RESULT_ERROR
+        return RESULT_OK if sent else RESULT_SKIPPED
+
+    outcomes = await asyncio.gather(*(_send(s, t) for s, t in players))
+    results = {s.device.serial_number: r for (s, _), r in zip(players, outcomes)}
+
+    _LOGGER.debug("Command %s results: %s", command, results)
+    hass.bus.async_fire(
+        EVENT_COMMAND_RESULT, {ATTR_COMMAND: command, ATTR_RESULTS: results}
+    )
+
+    return results
+
+
+@callback
+def _async_get_players(
+    hass: HomeAssistant,
+    entity_ids: list[str] | None = None,
+    timeout: float | None = None,
+) -> list[tuple[CommandScheduler, float | None]]:
+    """Returns schedulers of movie players of all loaded systems.
+
+    Players are optionally filtered by entity, and paired with the given timeout.
+    """
+    serial_numbers: set[str] | None = None
+    if entity_ids is not None:
+        registry = entity_registry.async_get(hass)
+        serial_numbers = {
+            entry.unique_id
+            for entry in map(registry.async_get, entity_ids)
+            if entry is not None and entry.platform == DOMAIN
+        }
+
+    entries: list[KaleidescapeEntryData] = list(hass.data.get(DOMAIN, {}).values())
+    players: list[tuple[CommandScheduler, float | None]] = []
+    for data in entries:
+        for serial_number, scheduler in data.schedulers.items():
+            if serial_numbers is None or serial_number in serial_numbers:
+                players.append((scheduler, timeout))
+
+    return players
@@ -0,0 +1,119 @@
+"""Per entry device event subscriptions for Kaleidescape."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from kaleidescape import const as kaleidescape_const
+
+from homeassistant.core import callback
+
+from .const import (
+    CONF_BRIDGE_EVENTS,
+    CONF_EVENTS,
+    CONF_PROFILE,
+    DEFAULT_PROFILE,
+    PROFILE_CUSTOM,
+    PROFILE_FULL,
+    PROFILE_TRANSPORT,
+)
+
+if TYPE_CHECKING:
+    from kaleidescape import Dispatcher
+
+# Device events delivered by each profile, None delivers all of them
+PROFILE_EVENTS: dict[str, list[str] | None] = {
+    PROFILE_TRANSPORT: [
+        kaleidescape_const.DEVICE_POWER_STATE,
+        kaleidescape_const.FRIENDLY_NAME,
+        kaleidescape_const.PLAY_STATUS,
+    ],
+    PROFILE_FULL: None,
+}
+
+
+def subscribed_events(options: Mapping[str, Any]) -> frozenset[str] | None:
+    """Returns device events an entry subscribes to, or None for all events."""
+    profile = options.get(CONF_PROFILE, DEFAULT_PROFILE)
+    if profile == PROFILE_CUSTOM:
+        events = options.get(CONF_EVENTS, [])
+    elif (events := PROFILE_EVENTS[profile]) is None:
+        return None
+
+    # Bridged events are always delivered, or the bridge would never fire them
+    subscribed = {*events, *options.get(CONF_BRIDGE_EVENTS, [])}
+    if kaleidescape_const.SCREEN_MASK in subscribed:
+        subscribed.add(kaleidescape_const.CINEMASCAPE_MASK)
+    return frozenset(subscribed)
+
+
+class _Subscription:
+    """Connected target of a SubscriptionDispatcher."""
+
+    __slots__ = ("_targets", "_target")
+
+    def __init__(self, targets: list[Callable], target: Callable) -> None:
+        """Initialize subscription."""
+        self._targets = targets
+        self._target = target
+
+    def disconnect(self) -> None:
+        """Stop delivering events to the target."""
+        if self._target in self._targets:
+            self._targets.remove(self._target)
+
+
+class SubscriptionDispatcher:
+    """Dispatcher of a config entry that delivers only subscribed device events.
+
+    A single listener per signal on the controller dispatcher drops unsubscribed
+    device events before any entity callback is scheduled, and calls the entry's
+    targets with the rest. Targets must be callbacks.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, events: Iterable[str]) -> None:
+        """Initialize dispatcher."""
+        self._dispatcher = dispatcher
+        self._events = frozenset(events)
+        self._targets: dict[str, list[Callable]] = {}
+        self._signals: list = []
+        self.dropped = 0
+
+    def connect(self, signal: str, target: Callable) -> _Subscription:
+        """Returns a subscription delivering signal to target."""
+        if (targets := self._targets.get(signal)) is None:
+            targets = self._targets[signal] = []
+            if signal == kaleidescape_const.SIGNAL_DEVICE_EVENT:
+                listener = self._async_device_event
+            else:
+                listener = self._forwarder(targets)
+            self._signals.append(self._dispatcher.connect(signal, listener))
+        targets.append(target)
+        return _Subscription(targets, target)
+
+    @callback
+    def async_stop(self) -> None:
+        """Disconnect from the controller dispatcher."""
+        for signal in self._signals:
+            signal.disconnect()
+        self._signals.clear()
+        self._targets.clear()
+
+    @callback
+    def _async_device_event(self, device_id: str, event: str) -> None:
+        """Deliver subscribed device events."""
+        if event not in self._events:
+            self.dropped += 1
+            return
+        for target in list(self._targets[kaleidescape_const.SIGNAL_DEVICE_EVENT]):
+            target(device_id, event)
+
+    @staticmethod
+    def _forwarder(targets: list[Callable]) -> Callable:
+        @callback
+        def _async_forward(*args: Any) -> None:
+            for target in list(targets):
+                target(*args)
+
+        return _async_forward
@@ -0,0 +1,261 @@
+"""Incremental watch time and usage statistics for Kaleidescape players."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from kaleidescape import const as kaleidescape_const
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SIGNAL_STATISTICS_UPDATED
+
+if TYPE_CHECKING:
+    from kaleidescape import Device as KaleidescapeDevice, Dispatcher
+
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 300
+
+# Fraction of a title that must be reached for it to count as finished
+FINISHED_RATIO = 0.95
+
+
+class UsageCounters:
+    """Running totals for a player or a title."""
+
+    __slots__ = ("played_seconds", "started", "finished", "sessions", "session_seconds")
+
+    def __init__(
+        self,
+        played_seconds: float = 0.0,
+        started: int = 0,
+        finished: int = 0,
+        sessions: int = 0,
+        session_seconds: float = 0.0,
+    ) -> None:
+        """Initialize counters."""
+        self.played_seconds = played_seconds
+        self.started = started
+        self.finished = finished
+        self.sessions = sessions
+        self.session_seconds = session_seconds
+
+    @property
+    def average_session_seconds(self) -> float | None:
+        """Average played time of completed sessions."""
+        if not self.sessions:
+            return None
+        return self.session_seconds / self.sessions
+
+    def as_list(self) -> list:
+        """Returns counters in a compact serializable form."""
+        return [getattr(self, name) for name in self.__slots__]
+
+
+class _Session:
+    """Playback of one title on a player, from start until stop or title change."""
+
+    __slots__ = ("handle", "played_seconds", "playing_since", "finished")
+
+    def __init__(
+        self, handle: str, played_seconds: float = 0.0, finished: bool = False
+    ) -> None:
+        self.handle = handle
+        self.played_seconds = played_seconds
+        self.playing_since: float | None = None
+        self.finished = finished
+
+    def as_list(self) -> list:
+        """Returns the session in a compact serializable form."""
+        return [self.handle, self.played_seconds, self.finished]
+
+
+class WatchStatistics:
+    """Aggregates usage statistics from device events as they arrive.
+
+    Every event does a constant amount of work against running counters, which
+    are persisted with a delayed Store write instead of being rebuilt from history.
+    Open sessions are persisted too, so a restart or reload during a title
+    resumes its session instead of counting a new start.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        dispatcher: Dispatcher,
+        devices: list[KaleidescapeDevice],
+    ) -> None:
+        """Initialize statistics."""
+        self._hass = hass
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.statistics.{entry_id}")
+        self._dispatcher = dispatcher
+        self._devices = devices
+        # Movie player addressed by each device id, None for other devices
+        self._players: dict[str, KaleidescapeDevice | None] = {}
+        self._signal = None
+        self._sessions: dict[str, _Session] = {}
+        self.players: dict[str, UsageCounters] = {}
+        self.titles: dict[str, UsageCounters] = {}
+
+    async def async_load(self) -> None:
+        """Load persisted counters."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self.players = {k: UsageCounters(*v) for k, v in data["players"].items()}
+        self.titles = {k: UsageCounters(*v) for k, v in data["titles"].items()}
+        self._sessions = {k: _Session(*v) for k, v in data.get("sessions", {}).items()}
+
+    async def async_save(self) -> None:
+        """Persist counters now."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_start(self) -> None:
+        """Start aggregating device events."""
+        self._signal = self._dispatcher.connect(
+            kaleidescape_const.SIGNAL_DEVICE_EVENT, self._async_device_event
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop aggregating, keeping open sessions to resume after a restart."""
+        if self._signal:
+            self._signal.disconnect()
+            self._signal = None
+        now = time.monotonic()
+        for serial_number, session in self._sessions.items():
+            self._accumulate(serial_number, session, now)
+
+    def player(self, serial_number: str) -> UsageCounters:
+        """Returns counters of a player."""
+        if (counters := self.players.get(serial_number)) is None:
+            counters = self.players[serial_number] = UsageCounters()
+        return counters
+
+    def title(self, handle: str) -> UsageCounters:
+        """Returns counters of a title."""
+        if (counters := self.titles.get(handle)) is None:
+            counters = self.titles[handle] = UsageCounters()
+        return counters
+
+    def current_handle(self, serial_number: str) -> str | None:
+        """Returns handle of the title in the open session of a player."""
+        if (session := self._sessions.get(serial_number)) is None:
+            return None
+        return session.handle
+
+    def signal(self, serial_number: str) -> str:
+        """Dispatcher signal sent when counters of a player change."""
+        return f"{SIGNAL_STATISTICS_UPDATED}_{serial_number}"
+
+    @callback
+    def _async_device_event(self, device_id: str, event: str) -> None:
+        """Handle device event from the controller."""
+        if event not in (
+            kaleidescape_const.PLAY_STATUS,
+            kaleidescape_const.DEVICE_POWER_STATE,
+        ):
+            return
+
+        if (device := self._async_get_player(device_id)) is None:
+            return
+
+        serial_number = device.serial_number
+        player = self.player(serial_number)
+        hours_before = round(player.played_seconds / 3600, 2)
+        started_before = player.started
+        finished_before = player.finished
+        sessions_before = player.sessions
+
+        self._update(device, time.monotonic())
+
+        if (
+            round(player.played_seconds / 3600, 2) != hours_before
+            or player.started != started_before
+            or player.finished != finished_before
+            or player.sessions != sessions_before
+        ):
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+            async_dispatcher_send(self._hass, self.signal(serial_number))
+
+    @callback
+    def _async_get_player(self, device_id: str) -> KaleidescapeDevice | None:
+        """Returns the movie player addressed by device_id."""
+        try:
+            return self._players[device_id]
+        except KeyError:
+            pass
+        device = next((d for d in self._devices if d.has_device_id(device_id)), None)
+        if device is not None and not device.is_movie_player:
+            device = None
+        self._players[device_id] = device
+        return device
+
+    def _update(self, device: KaleidescapeDevice, now: float) -> None:
+        """Apply the current device state to the counters."""
+        serial_number = device.serial_number
+        movie = device.movie
+        session = self._sessions.get(serial_number)
+
+        in_standby = (
+            device.power.state == kaleidescape_const.DEVICE_POWER_STATE_STANDBY
+        )
+        stopped = movie.play_status == kaleidescape_const.PLAY_STATUS_NONE
+
+        if session is not None and (
+            in_standby or stopped or not movie.handle or movie.handle != session.handle
+        ):
+            self._end_session(serial_number, now)
+            session = None
+
+        if in_standby or stopped or not movie.handle:
+            return
+
+        if session is None:
+            session = self._sessions[serial_number] = _Session(movie.handle)
+            self.player(serial_number).started += 1
+            self.title(movie.handle).started += 1
+
+        self._accumulate(serial_number, session, now)
+        if movie.play_status == kaleidescape_const.PLAY_STATUS_PLAYING:
+            session.playing_since = now
+
+        if (
+            not session.finished
+            and movie.title_length
+            and movie.title_location >= FINISHED_RATIO * movie.title_length
+        ):
+            session.finished = True
+            self.player(serial_number).finished += 1
+            self.title(session.handle).finished += 1
+
+    def _accumulate(self, serial_number: str, session: _Session, now: float) -> None:
+        """Add time played since the last event to the counters."""
+        if session.playing_since is None:
+            return
+        played = now - session.playing_since
+        session.playing_since = None
+        session.played_seconds += played
+        self.player(serial_number).played_seconds += played
+        self.title(session.handle).played_seconds += played
+
+    def _end_session(self, serial_number: str, now: float) -> None:
+        """Close the open session of a player."""
+        session = self._sessions.pop(serial_number)
+        self._accumulate(serial_number, session, now)
+        for counters in (self.player(serial_number), self.title(session.handle)):
+            counters.sessions += 1
+            counters.session_seconds += session.played_seconds
+
+    def _data_to_save(self) -> dict:
+        return {
+            "players": {k: v.as_list() for k, v in self.players.items()},
+            "titles": {k: v.as_list() for k, v in self.titles.items()},
+            "sessions": {k: v.as_list() for k, v in self._sessions.items()},
+        }
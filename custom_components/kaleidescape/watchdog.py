@@ -0,0 +1,200 @@
+"""Connection health monitoring for Kaleidescape systems."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import timedelta
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from kaleidescape.error import KaleidescapeError
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    SIGNAL_WATCHDOG_UPDATED,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from kaleidescape import Kaleidescape
+
+    from homeassistant.core import HomeAssistant
+
+PROBE_INTERVAL = timedelta(seconds=30)
+MAX_FAILED_PROBES = 2
+
+# Smoothing factors and clamps for the RTT estimate, as used for TCP
+# retransmission timers (RFC 6298)
+RTT_ALPHA = 0.125
+RTT_BETA = 0.25
+RTT_K = 4
+MIN_COMMAND_TIMEOUT = 1.0
+MAX_COMMAND_TIMEOUT = 10.0
+MIN_CONNECT_TIMEOUT = 2.0
+MAX_CONNECT_TIMEOUT = 15.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionWatchdog:
+    """Probes a system connection and derives timeouts from the measured RTT.
+
+    A lightweight request is sent periodically. Round trip times feed a smoothed
+    estimate and variance, which set command and connect timeouts. When probes
+    stop being answered the connection is assumed half-open and is re-established
+    without waiting for a user command to fail.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        controller: Kaleidescape,
+        system_id: str,
+    ) -> None:
+        """Initialize watchdog."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._controller = controller
+        self._system_id = system_id
+        self._remove_interval = None
+        self._probe_task: asyncio.Task | None = None
+        self._probing = False
+        self._reconnect_needed = False
+        self.srtt: float | None = None
+        self.rttvar: float | None = None
+        self.last_rtt: float | None = None
+        self.failed_probes = 0
+        self.reconnects = 0
+
+    @property
+    def signal(self) -> str:
+        """Dispatcher signal sent after each probe."""
+        return f"{SIGNAL_WATCHDOG_UPDATED}_{self._entry_id}"
+
+    @property
+    def command_timeout(self) -> float:
+        """Timeout for a single command round trip, in seconds."""
+        if self.srtt is None:
+            return DEFAULT_COMMAND_TIMEOUT
+        timeout = self.srtt + RTT_K * self.rttvar
+        return min(max(timeout, MIN_COMMAND_TIMEOUT), MAX_COMMAND_TIMEOUT)
+
+    @property
+    def connect_timeout(self) -> float:
+        """Timeout for establishing a connection, in seconds."""
+        if self.srtt is None:
+            return DEFAULT_CONNECT_TIMEOUT
+        # Connecting takes a few round trips (resolve, handshake, first request)
+        timeout = 3 * (self.srtt + RTT_K * self.rttvar)
+        return min(max(timeout, MIN_CONNECT_TIMEOUT), MAX_CONNECT_TIMEOUT)
+
+    @callback
+    def async_start(self) -> None:
+        """Start periodic probing."""
+        self._remove_interval = async_track_time_interval(
+            self._hass, self._async_schedule_probe, PROBE_INTERVAL
+        )
+        self._async_schedule_probe()
+
+    async def async_stop(self) -> None:
+        """Stop periodic probing and wait for a running probe to be cancelled.
+
+        A reconnect must not complete after the entry has disconnected, or it
+        leaves an orphaned auto reconnecting connection behind.
+        """
+        if self._remove_interval:
+            self._remove_interval()
+            self._remove_interval = None
+        if (task := self._probe_task) is not None:
+            self._probe_task = None
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    @callback
+    def _async_schedule_probe(self, now: datetime | None = None) -> None:
+        """Start a probe task unless one is still running."""
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = self._hass.async_create_task(self.async_probe())
+
+    def add_sample(self, rtt: float) -> None:
+        """Update the smoothed RTT estimate with a new sample, in seconds."""
+        self.last_rtt = rtt
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            deviation = abs(self.srtt - rtt)
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * deviation
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+
+    async def async_probe(self) -> None:
+        """Send a probe and reconnect if probes keep failing."""
+        if self._probing or self._remove_interval is None:
+            return
+
+        self._probing = True
+        try:
+            await self._async_probe()
+        finally:
+            self._probing = False
+
+        async_dispatcher_send(self._hass, self.signal)
+
+    async def _async_probe(self) -> None:
+        if self._reconnect_needed:
+            # A previous proactive reconnect failed, the library will not retry it
+            await self._async_reconnect()
+            return
+
+        device = await self._controller.get_local_device()
+        if device is None or not device.is_connected:
+            # Library auto reconnect is already in charge
+            return
+
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(
+                device.get_friendly_system_name(), self.command_timeout
+            )
+        except (asyncio.TimeoutError, KaleidescapeError, ConnectionError) as err:
+            self.failed_probes += 1
+            _LOGGER.debug(
+                "Probe to %s failed (%s), %s in a row",
+                device.serial_number,
+                type(err).__name__,
+                self.failed_probes,
+            )
+            if self.failed_probes >= MAX_FAILED_PROBES:
+                self._reconnect_needed = True
+                await self._async_reconnect()
+            return
+
+        self.failed_probes = 0
+        self.add_sample(time.monotonic() - start)
+
+    async def _async_reconnect(self) -> None:
+        _LOGGER.warning(
+            "Connection stalled, reconnecting to system %s", self._system_id
+        )
+        self.reconnects += 1
+        await self._controller.disconnect()
+        try:
+            await asyncio.wait_for(
+                self._controller.connect(self._system_id, auto_reconnect=True),
+                self.connect_timeout,
+            )
+        except (asyncio.TimeoutError, KaleidescapeError, ConnectionError) as err:
+            _LOGGER.warning("Reconnect to system %s failed: %s", self._system_id, err)
+            return
+        self._reconnect_needed = False
+        self.failed_probes = 0
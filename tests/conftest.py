@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+import os
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
@@ -19,6 +20,12 @@ from tests.common import MockConfigEntry
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
+# Timing budgets depend on the machine, benchmarks only run when requested
+benchmark = pytest.mark.skipif(
+    not os.environ.get("KALEIDESCAPE_BENCHMARK"),
+    reason="benchmarks run with KALEIDESCAPE_BENCHMARK=1",
+)
+
 
 def create_kaleidescape_device(
     kaleidescape: AsyncMock, serial_number: str, is_local: bool = True
@@ -0,0 +1,101 @@
+"""Tests for Kaleidescape cover art processing."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from kaleidescape import const as kaleidescape_const
+from kaleidescape.device import Movie
+from PIL import Image
+
+from homeassistant.components.kaleidescape.artwork import (
+    THUMBNAIL_SIZE,
+    ArtworkCache,
+    process_cover,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from tests.common import MockConfigEntry
+    from tests.test_util.aiohttp import AiohttpClientMocker
+
+COVER_URL = "http://127.0.0.1/cover.jpg"
+
+
+def _cover_image() -> bytes:
+    """Returns a two color cover, mostly red."""
+    image = Image.new("RGB", (600, 900), (200, 0, 0))
+    image.paste((0, 0, 200), (0, 0, 600, 200))
+    output = io.BytesIO()
+    image.save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_process_cover() -> None:
+    """Test thumbnail is resized and palette starts with the dominant color."""
+    artwork = process_cover(_cover_image())
+
+    with Image.open(io.BytesIO(artwork.thumbnail)) as thumbnail:
+        assert thumbnail.width <= THUMBNAIL_SIZE[0]
+        assert thumbnail.height <= THUMBNAIL_SIZE[1]
+    assert artwork.content_type == "image/jpeg"
+    assert artwork.palette[0] == "#c80000"
+    assert "#0000c8" in artwork.palette
+
+
+async def test_concurrent_requests_share_fetch(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a handle is fetched and processed once."""
+    aioclient_mock.get(COVER_URL, content=_cover_image())
+    cache = ArtworkCache(hass)
+
+    results = await asyncio.gather(
+        *(cache.async_get("handle", COVER_URL) for _ in range(3))
+    )
+
+    assert aioclient_mock.call_count == 1
+    assert results[0] is not None
+    assert results[0] is results[1] is results[2]
+    assert cache.get("handle") is results[0]
+
+
+async def test_failed_fetch_cached(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a cover that cannot be fetched is not retried."""
+    aioclient_mock.get(COVER_URL, status=404)
+    cache = ArtworkCache(hass)
+
+    assert await cache.async_get("handle", COVER_URL) is None
+    assert await cache.async_get("handle", COVER_URL) is None
+    assert aioclient_mock.call_count == 1
+
+
+async def test_media_player_palette(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Test the media player exposes the palette of the playing title."""
+    aioclient_mock.get(COVER_URL, content=_cover_image())
+    device = await mock_kaleidescape.get_local_device()
+    device.movie = Movie(
+        handle="handle",
+        title="title",
+        cover=COVER_URL,
+        play_status=kaleidescape_const.PLAY_STATUS_PLAYING,
+    )
+    mock_kaleidescape.dispatcher.send(
+        kaleidescape_const.SIGNAL_DEVICE_EVENT, "#123", kaleidescape_const.PLAY_STATUS
+    )
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+    entity = hass.states.get("media_player.device_123_kaleidescape")
+    assert entity.attributes["media_image_palette"][0] == "#c80000"
@@ -0,0 +1,100 @@
+"""Tests for Kaleidescape event bus bridge."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from kaleidescape import const as kaleidescape_const
+
+from homeassistant.components.kaleidescape.const import (
+    CONF_BRIDGE_EVENTS,
+    CONF_BRIDGE_RATE_LIMIT,
+    DOMAIN,
+    EVENT_KALEIDESCAPE,
+)
+from homeassistant.const import CONF_HOST, CONF_ID
+from homeassistant.util import dt as dt_util
+
+from tests.common import MockConfigEntry, async_capture_events, async_fire_time_changed
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def _setup_entry(hass: HomeAssistant, options: dict) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="123456789",
+        version=2,
+        data={CONF_ID: "123456789", CONF_HOST: "127.0.0.1"},
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def _send_event(hass: HomeAssistant, kaleidescape: AsyncMock, event: str):
+    kaleidescape.dispatcher.send(kaleidescape_const.SIGNAL_DEVICE_EVENT, "#123", event)
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+
+async def test_bridge_disabled_by_default(
+    hass: HomeAssistant, mock_kaleidescape: AsyncMock
+) -> None:
+    """Test no bus events are fired unless enabled."""
+    await _setup_entry(hass, {})
+    events = async_capture_events(hass, EVENT_KALEIDESCAPE)
+
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+
+    assert len(events) == 0
+
+
+async def test_bridge_allowlist(
+    hass: HomeAssistant, mock_kaleidescape: AsyncMock
+) -> None:
+    """Test only allowed event types are republished."""
+    await _setup_entry(hass, {CONF_BRIDGE_EVENTS: [kaleidescape_const.SCREEN_MASK]})
+    events = async_capture_events(hass, EVENT_KALEIDESCAPE)
+    device = await mock_kaleidescape.get_local_device()
+
+    device.automation.screen_mask_ratio = "2.35"
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.SCREEN_MASK)
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+
+    assert len(events) == 1
+    assert events[0].data["serial_number"] == "123"
+    assert events[0].data["event"] == kaleidescape_const.SCREEN_MASK
+    assert events[0].data["screen_mask_ratio"] == "2.35"
+
+
+async def test_bridge_rate_limit_coalesces(
+    hass: HomeAssistant, mock_kaleidescape: AsyncMock
+) -> None:
+    """Test events inside the rate limit window collapse to the latest payload."""
+    await _setup_entry(
+        hass,
+        {
+            CONF_BRIDGE_EVENTS: [kaleidescape_const.PLAY_STATUS],
+            CONF_BRIDGE_RATE_LIMIT: 1.0,
+        },
+    )
+    events = async_capture_events(hass, EVENT_KALEIDESCAPE)
+    device = await mock_kaleidescape.get_local_device()
+
+    for location in range(1, 6):
+        device.movie.title_location = location
+        await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+
+    assert [e.data["title_location"] for e in events] == [1]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert [e.data["title_location"] for e in events] == [1, 5]
@@ -5,7 +5,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 
-from homeassistant.components.kaleidescape.const import DEFAULT_HOST, DOMAIN
+from homeassistant.components.kaleidescape.const import (
+    CONF_BRIDGE_EVENTS,
+    CONF_BRIDGE_RATE_LIMIT,
+    CONF_EVENTS,
+    CONF_PROFILE,
+    DEFAULT_HOST,
+    DOMAIN,
+    PROFILE_CUSTOM,
+    PROFILE_FULL,
+)
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.const import CONF_HOST, CONF_ID
 from homeassistant.data_entry_flow import (
@@ -102,3 +111,50 @@ async def test_config_flow_device_exists_abort(
     )
     assert result["type"] == RESULT_TYPE_ABORT
     assert result["reason"] == "already_configured"
+
+
+async def test_options_flow(
+    hass: HomeAssistant, mock_kaleidescape: AsyncMock, mock_integration: MockConfigEntry
+) -> None:
+    """Test options flow enables the event bridge."""
+    result = await hass.config_entries.options.async_init(mock_integration.entry_id)
+    assert result["type"] == RESULT_TYPE_FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_BRIDGE_EVENTS: ["SCREEN_MASK"],
+            CONF_BRIDGE_RATE_LIMIT: 0.5,
+        },
+    )
+    await hass.async_block_till_done()
+    assert result["type"] == RESULT_TYPE_CREATE_ENTRY
+    assert mock_integration.options == {
+        CONF_PROFILE: PROFILE_FULL,
+        CONF_BRIDGE_EVENTS: ["SCREEN_MASK"],
+        CONF_BRIDGE_RATE_LIMIT: 0.5,
+    }
+    assert hass.data[DOMAIN][mock_integration.entry_id].bridge is not None
+
+
+async def test_options_flow_custom_profile(
+    hass: HomeAssistant, mock_kaleidescape: AsyncMock, mock_integration: MockConfigEntry
+) -> None:
+    """Test options flow selects custom subscribed events."""
+    result = await hass.config_entries.options.async_init(mock_integration.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_PROFILE: PROFILE_CUSTOM}
+    )
+    assert result["type"] == RESULT_TYPE_FORM
+    assert result["step_id"] == "events"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_EVENTS: ["PLAY_STATUS"]}
+    )
+    await hass.async_block_till_done()
+    assert result["type"] == RESULT_TYPE_CREATE_ENTRY
+    assert mock_integration.options[CONF_PROFILE] == PROFILE_CUSTOM
+    assert mock_integration.options[CONF_EVENTS] == ["PLAY_STATUS"]
+    data = hass.data[DOMAIN][mock_integration.entry_id]
+    assert data.dispatcher is not mock_kaleidescape.dispatcher
@@ -0,0 +1,285 @@
+"""Tests for Kaleidescape device triggers."""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from kaleidescape import const as kaleidescape_const
+import pytest
+
+import homeassistant.components.automation as automation
+from homeassistant.components.kaleidescape.const import DOMAIN
+from homeassistant.components.kaleidescape.device_trigger import (
+    TRIGGER_EVENTS,
+    TRIGGER_PLAYING,
+    async_attach_trigger,
+)
+from homeassistant.const import STATE_PLAYING
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.setup import async_setup_component
+
+from tests.common import async_get_device_automations, async_mock_service
+
+from .conftest import benchmark
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall
+
+    from tests.common import MockConfigEntry
+
+BENCHMARK_EVENTS = 500
+
+
+@pytest.fixture(name="calls")
+def fixture_calls(hass: HomeAssistant) -> list[ServiceCall]:
+    """Track calls to a mock service."""
+    return async_mock_service(hass, "test", "automation")
+
+
+async def _get_device_id(hass: HomeAssistant, serial_number: str = "123") -> str:
+    device_registry = await hass.helpers.device_registry.async_get_registry()
+    device = device_registry.async_get_device(identifiers={(DOMAIN, serial_number)})
+    return device.id
+
+
+async def _send_event(hass: HomeAssistant, kaleidescape: AsyncMock, event: str):
+    kaleidescape.dispatcher.send(kaleidescape_const.SIGNAL_DEVICE_EVENT, "#123", event)
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+
+async def test_get_triggers(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test all trigger types are listed for a player."""
+    device_id = await _get_device_id(hass)
+    triggers = await async_get_device_automations(hass, "trigger", device_id)
+    assert {t["type"] for t in triggers} == set(TRIGGER_EVENTS)
+
+
+async def test_play_status_triggers(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+    calls: list[ServiceCall],
+) -> None:
+    """Test play status triggers fire on transitions only."""
+    device_id = await _get_device_id(hass)
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "device",
+                        "domain": DOMAIN,
+                        "device_id": device_id,
+                        "type": trigger_type,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {"type": trigger_type},
+                    },
+                }
+                for trigger_type in ("playing", "paused")
+            ]
+        },
+    )
+    device = await mock_kaleidescape.get_local_device()
+
+    device.movie.play_status = kaleidescape_const.PLAY_STATUS_PLAYING
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+    # Position updates repeat the play status and must not fire again
+    device.movie.title_location = 10
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+    device.movie.play_status = kaleidescape_const.PLAY_STATUS_PAUSED
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+
+    assert [c.data["type"] for c in calls] == ["playing", "paused"]
+
+
+async def test_screen_mask_trigger(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+    calls: list[ServiceCall],
+) -> None:
+    """Test screen mask trigger passes mask values to the automation."""
+    device_id = await _get_device_id(hass)
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "device",
+                    "domain": DOMAIN,
+                    "device_id": device_id,
+                    "type": "screen_mask_changed",
+                },
+                "action": {
+                    "service": "test.automation",
+                    "data_template": {"ratio": "{{ trigger.screen_mask_ratio }}"},
+                },
+            }
+        },
+    )
+    device = await mock_kaleidescape.get_local_device()
+
+    device.automation.screen_mask_ratio = "2.35"
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.SCREEN_MASK)
+
+    assert len(calls) == 1
+    assert calls[0].data["ratio"] == "2.35"
+
+
+async def test_trigger_fires_before_state_change(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test device triggers fire ahead of the state change path."""
+    device_id = await _get_device_id(hass)
+    device = await mock_kaleidescape.get_local_device()
+    fired: list[str] = []
+
+    @callback
+    def _device_trigger(variables: dict, context=None) -> None:
+        fired.append("device_trigger")
+
+    @callback
+    def _state_trigger(event) -> None:
+        fired.append("state_trigger")
+
+    remove_device_trigger = await async_attach_trigger(
+        hass,
+        {
+            "platform": "device",
+            "domain": DOMAIN,
+            "device_id": device_id,
+            "type": TRIGGER_PLAYING,
+        },
+        _device_trigger,
+        {},
+    )
+    remove_state_trigger = async_track_state_change_event(
+        hass, "media_player.device_123_kaleidescape", _state_trigger
+    )
+
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    device.movie.play_status = kaleidescape_const.PLAY_STATUS_PLAYING
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+
+    remove_device_trigger()
+    remove_state_trigger()
+
+    assert fired == ["device_trigger", "state_trigger"]
+
+
+async def test_trigger_attaches_before_entry_loads(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test a trigger attached before setup fires once the entry is loaded."""
+    mock_config_entry.add_to_hass(hass)
+    device_registry = await hass.helpers.device_registry.async_get_registry()
+    device_id = device_registry.async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id, identifiers={(DOMAIN, "123")}
+    ).id
+    fired: list[dict] = []
+
+    @callback
+    def _device_trigger(variables: dict, context=None) -> None:
+        fired.append(variables)
+
+    remove_trigger = await async_attach_trigger(
+        hass,
+        {
+            "platform": "device",
+            "domain": DOMAIN,
+            "device_id": device_id,
+            "type": TRIGGER_PLAYING,
+        },
+        _device_trigger,
+        {},
+    )
+
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    device = await mock_kaleidescape.get_local_device()
+    device.movie.play_status = kaleidescape_const.PLAY_STATUS_PLAYING
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+    remove_trigger()
+
+    assert len(fired) == 1
+
+
+@benchmark
+async def test_trigger_latency(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Benchmark event to trigger latency of device and state triggers."""
+    device_id = await _get_device_id(hass)
+    device = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    device_latencies: list[float] = []
+    state_latencies: list[float] = []
+    sent_at = 0.0
+
+    @callback
+    def _device_trigger(variables: dict, context=None) -> None:
+        device_latencies.append(time.perf_counter() - sent_at)
+
+    @callback
+    def _state_trigger(event) -> None:
+        if event.data["new_state"].state == STATE_PLAYING:
+            state_latencies.append(time.perf_counter() - sent_at)
+
+    remove_device_trigger = await async_attach_trigger(
+        hass,
+        {
+            "platform": "device",
+            "domain": DOMAIN,
+            "device_id": device_id,
+            "type": TRIGGER_PLAYING,
+        },
+        _device_trigger,
+        {},
+    )
+    remove_state_trigger = async_track_state_change_event(
+        hass, "media_player.device_123_kaleidescape", _state_trigger
+    )
+
+    for i in range(BENCHMARK_EVENTS * 2):
+        device.movie.play_status = (
+            kaleidescape_const.PLAY_STATUS_PAUSED
+            if i % 2
+            else kaleidescape_const.PLAY_STATUS_PLAYING
+        )
+        sent_at = time.perf_counter()
+        # Each event is delivered before the next one is sent
+        await _send_event(hass, mock_kaleidescape, kaleidescape_const.PLAY_STATUS)
+
+    remove_device_trigger()
+    remove_state_trigger()
+
+    assert len(device_latencies) == BENCHMARK_EVENTS
+    assert len(state_latencies) == BENCHMARK_EVENTS
+    device_p50 = statistics.median(device_latencies)
+    state_p50 = statistics.median(state_latencies)
+    assert device_p50 <= state_p50, (
+        f"device trigger p50 {device_p50 * 1e6:.0f}us, "
+        f"state trigger p50 {state_p50 * 1e6:.0f}us"
+    )
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 
 import pytest
 
-from homeassistant.components.kaleidescape.const import DOMAIN
+from homeassistant.components.kaleidescape.const import CONF_REVALIDATE, DOMAIN
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_ID
 
@@ -121,3 +122,80 @@ async def test_version_1_migration(
     await hass.async_block_till_done()
     assert mock_config_entry.state is ConfigEntryState.LOADED
     assert mock_config_entry.version == 2
+    assert mock_config_entry.title == "Kaleidescape (Cinema)"
+    assert mock_config_entry.data == {CONF_ID: "123456789", CONF_HOST: "127.0.0.1"}
+
+
+async def test_version_1_migration_offline(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock
+) -> None:
+    """Test migrating without network keeps placeholders for revalidation."""
+    mock_kaleidescape.discover.side_effect = ConnectionError
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Theater",
+        unique_id="123456789",
+        version=1,
+        data={CONF_ID: "123456789", CONF_HOST: "127.0.0.1"},
+    )
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_config_entry.version == 2
+    assert mock_config_entry.title == "Theater"
+    assert mock_config_entry.data[CONF_REVALIDATE] is True
+    assert mock_kaleidescape.discover.call_count == 1
+
+
+async def test_version_1_migration_placeholder_id(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock
+) -> None:
+    """Test a placeholder id that does not connect is revalidated for the retry."""
+
+    async def _connect(system_id: str, **kwargs) -> None:
+        if system_id != "123456789":
+            raise ConnectionError
+
+    mock_kaleidescape.connect.side_effect = _connect
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="old",
+        version=1,
+        data={CONF_ID: "old", CONF_HOST: "127.0.0.1"},
+    )
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+    assert mock_config_entry.unique_id == "123456789"
+    assert mock_config_entry.data == {CONF_ID: "123456789", CONF_HOST: "127.0.0.1"}
+
+    await hass.config_entries.async_reload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert mock_kaleidescape.connect.call_count == 2
+
+
+@pytest.mark.parametrize("error", [ConnectionError, asyncio.TimeoutError])
+async def test_version_1_migration_without_id(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    error: type[Exception],
+) -> None:
+    """Test an entry without an id is not connected until it is revalidated."""
+    mock_kaleidescape.discover.side_effect = error
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=1,
+        data={CONF_HOST: "127.0.0.1"},
+    )
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+    assert mock_config_entry.data == {CONF_HOST: "127.0.0.1", CONF_REVALIDATE: True}
+    assert mock_kaleidescape.discover.call_count == 1
+    assert mock_kaleidescape.connect.call_count == 0
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
@@ -12,6 +13,7 @@ from kaleidescape.device import Movie
 from homeassistant.components.media_player.const import DOMAIN as MEDIA_PLAYER_DOMAIN
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
     SERVICE_MEDIA_PAUSE,
     SERVICE_MEDIA_PLAY,
     SERVICE_MEDIA_STOP,
@@ -22,12 +24,18 @@ from homeassistant.const import (
     STATE_PAUSED,
     STATE_PLAYING,
 )
+from homeassistant.core import callback
+
+from .conftest import benchmark
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from tests.common import MockConfigEntry
 
+BENCHMARK_WRITES = 2000
+MIN_WRITES_PER_SECOND = 1000
+
 
 async def test_entity(
     hass: HomeAssistant,
@@ -39,6 +47,18 @@ async def test_entity(
     assert media_player.state == STATE_OFF
     assert media_player.attributes["friendly_name"] == "Device 123 Kaleidescape"
 
+    device: AsyncMock = await mock_kaleidescape.get_local_device()
+    device.system.friendly_name = "Theater"
+    mock_kaleidescape.dispatcher.send(
+        kaleidescape_const.SIGNAL_DEVICE_EVENT,
+        "#123",
+        kaleidescape_const.FRIENDLY_NAME,
+    )
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    media_player = hass.states.get("media_player.device_123_kaleidescape")
+    assert media_player.attributes["friendly_name"] == "Theater Kaleidescape"
+
     # For coverage report
     mock_kaleidescape.dispatcher.send(
         kaleidescape_const.SIGNAL_CONTROLLER_EVENT,
@@ -117,6 +137,45 @@ async def test_update_state(
     assert entity.state == STATE_PAUSED
 
 
+async def test_unmapped_event_ignored(
+    hass: HomeAssistant,
+    mock_kaleidescape: MagicMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test device events the player does not map leave its snapshot untouched."""
+    device: AsyncMock = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    device.movie = Movie(
+        handle="handle",
+        title="title",
+        play_status=kaleidescape_const.PLAY_STATUS_PLAYING,
+        title_length=100,
+        title_location=10,
+    )
+
+    async def _send(event: str) -> None:
+        mock_kaleidescape.dispatcher.send(
+            kaleidescape_const.SIGNAL_DEVICE_EVENT, "#123", event
+        )
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+
+    await _send(kaleidescape_const.PLAY_STATUS)
+    before = hass.states.get("media_player.device_123_kaleidescape")
+
+    device.movie.title_location = 20
+    await _send("unmapped_event")
+    # The next unrelated write publishes the position of the last play status
+    await _send(kaleidescape_const.MOVIE_LOCATION)
+
+    entity = hass.states.get("media_player.device_123_kaleidescape")
+    assert entity.attributes["media_position"] == 10
+    assert (
+        entity.attributes["media_position_updated_at"]
+        == before.attributes["media_position_updated_at"]
+    )
+
+
 async def test_turn_on(
     hass: HomeAssistant,
     mock_kaleidescape: MagicMock,
@@ -140,6 +199,7 @@ async def test_turn_off(
 ) -> None:
     """Test turn off service call."""
     device: AsyncMock = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
     await hass.services.async_call(
         MEDIA_PLAYER_DOMAIN,
         SERVICE_TURN_OFF,
@@ -149,6 +209,22 @@ async def test_turn_off(
     assert device.enter_standby.call_count == 1
 
 
+async def test_turn_off_in_standby(
+    hass: HomeAssistant,
+    mock_kaleidescape: MagicMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test turn off service call is dropped when already in standby."""
+    device: AsyncMock = await mock_kaleidescape.get_local_device()
+    await hass.services.async_call(
+        MEDIA_PLAYER_DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "media_player.device_123_kaleidescape"},
+        blocking=True,
+    )
+    assert device.enter_standby.call_count == 0
+
+
 async def test_play(
     hass: HomeAssistant,
     mock_kaleidescape: MagicMock,
@@ -209,3 +285,68 @@ async def test_device(
     assert device.model == "Strato"
     assert device.sw_version == "10.4.2-19218"
     assert device.manufacturer == "Kaleidescape"
+
+
+async def _async_send_positions(
+    hass: HomeAssistant, mock_kaleidescape: MagicMock
+) -> int:
+    """Returns state writes caused by BENCHMARK_WRITES position updates."""
+    device: AsyncMock = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    device.movie = Movie(
+        handle="handle",
+        title="title",
+        play_status=kaleidescape_const.PLAY_STATUS_PLAYING,
+        title_length=BENCHMARK_WRITES,
+    )
+    writes = 0
+
+    @callback
+    def _state_changed(event) -> None:
+        nonlocal writes
+        if event.data["entity_id"] == "media_player.device_123_kaleidescape":
+            writes += 1
+
+    remove_listener = hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+
+    for position in range(1, BENCHMARK_WRITES + 1):
+        device.movie.title_location = position
+        mock_kaleidescape.dispatcher.send(
+            kaleidescape_const.SIGNAL_DEVICE_EVENT,
+            "#123",
+            kaleidescape_const.PLAY_STATUS,
+        )
+        await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    remove_listener()
+
+    return writes
+
+
+async def test_position_updates_write_state(
+    hass: HomeAssistant,
+    mock_kaleidescape: MagicMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test every position update writes state once."""
+    writes = await _async_send_positions(hass, mock_kaleidescape)
+
+    entity = hass.states.get("media_player.device_123_kaleidescape")
+    assert entity.state == STATE_PLAYING
+    assert entity.attributes["media_position"] == BENCHMARK_WRITES
+    assert writes == BENCHMARK_WRITES
+
+
+@benchmark
+async def test_state_write_rate(
+    hass: HomeAssistant,
+    mock_kaleidescape: MagicMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Benchmark state writes per second driven by position updates."""
+    started = time.perf_counter()
+    writes = await _async_send_positions(hass, mock_kaleidescape)
+    elapsed = time.perf_counter() - started
+
+    rate = writes / elapsed
+    assert rate > MIN_WRITES_PER_SECOND, f"media player state writes: {rate:.0f}/s"
@@ -0,0 +1,215 @@
+"""Scale tests for many Kaleidescape systems and players per instance.
+
+Time budgets depend on the machine, they only run with KALEIDESCAPE_BENCHMARK=1.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+
+from kaleidescape import Dispatcher, Kaleidescape, const as kaleidescape_const
+from kaleidescape.connection import Connection
+import pytest
+
+from homeassistant.components.kaleidescape.const import DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_ID, STATE_PLAYING
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry
+
+from .conftest import benchmark, create_kaleidescape_device
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+SYSTEMS = 24
+PLAYERS_PER_SYSTEM = 10
+PLAYERS = SYSTEMS * PLAYERS_PER_SYSTEM
+STORM_ROUNDS = 20
+
+STORM_EVENTS = [
+    kaleidescape_const.DEVICE_POWER_STATE,
+    kaleidescape_const.PLAY_STATUS,
+    kaleidescape_const.MOVIE_LOCATION,
+    kaleidescape_const.SCREEN_MASK,
+    kaleidescape_const.VIDEO_COLOR,
+]
+
+# Regression limits, well above what the integration needs today. Memory is
+# counted by tracemalloc and enforced on every run.
+MAX_SETUP_TIME = 10.0
+MAX_MEMORY_PER_PLAYER = 256 * 1024
+MAX_CPU_PER_EVENT = 0.002
+
+
+def _create_controller(index: int) -> MagicMock:
+    """Returns a mock controller of a system with many players."""
+    controller = create_autospec(Kaleidescape, instance=True)
+    controller.connection = AsyncMock(
+        Connection, connected=True, state=kaleidescape_const.STATE_CONNECTED
+    )
+    controller.dispatcher = Dispatcher()
+    devices = [
+        create_kaleidescape_device(controller, f"{index:02d}{player:02d}", player == 0)
+        for player in range(PLAYERS_PER_SYSTEM)
+    ]
+    controller.get_devices = AsyncMock(return_value=devices)
+    controller.get_local_device = AsyncMock(return_value=devices[0])
+    return controller
+
+
+@pytest.fixture(name="mock_controllers")
+def fixture_mock_controllers() -> dict[str, MagicMock]:
+    """Returns mocked controllers of many systems, keyed by host."""
+    controllers = {f"10.0.{i}.1": _create_controller(i) for i in range(SYSTEMS)}
+    with patch(
+        "homeassistant.components.kaleidescape.Kaleidescape", autospec=True
+    ) as mock:
+        mock.side_effect = lambda host, **kwargs: controllers[host]
+        yield controllers
+
+
+@pytest.fixture(name="mock_config_entries")
+def fixture_mock_config_entries(hass: HomeAssistant) -> list[MockConfigEntry]:
+    """Returns a config entry for each mocked system."""
+    entries = []
+    for i in range(SYSTEMS):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=f"system{i}",
+            version=2,
+            data={CONF_ID: f"system{i}", CONF_HOST: f"10.0.{i}.1"},
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    return entries
+
+
+async def _async_setup_entries(hass: HomeAssistant) -> None:
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+
+async def test_scale_setup(
+    hass: HomeAssistant,
+    mock_controllers: dict[str, MagicMock],
+    mock_config_entries: list[MockConfigEntry],
+) -> None:
+    """Test every player of many systems is set up."""
+    await _async_setup_entries(hass)
+
+    assert all(e.state is ConfigEntryState.LOADED for e in mock_config_entries)
+    assert len(hass.states.async_entity_ids("media_player")) == PLAYERS
+
+
+@benchmark
+async def test_scale_setup_time(
+    hass: HomeAssistant,
+    mock_controllers: dict[str, MagicMock],
+    mock_config_entries: list[MockConfigEntry],
+) -> None:
+    """Test setup time of many systems stays within budget."""
+    started = time.perf_counter()
+    await _async_setup_entries(hass)
+    elapsed = time.perf_counter() - started
+
+    assert len(hass.states.async_entity_ids("media_player")) == PLAYERS
+    assert elapsed < MAX_SETUP_TIME, f"setup of {PLAYERS} players: {elapsed:.2f}s"
+
+
+async def test_scale_memory(
+    hass: HomeAssistant,
+    mock_controllers: dict[str, MagicMock],
+    mock_config_entries: list[MockConfigEntry],
+) -> None:
+    """Test memory allocated per player stays within budget."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        await _async_setup_entries(hass)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(hass.states.async_entity_ids("media_player")) == PLAYERS
+
+    per_player = (after - before) / PLAYERS
+    assert (
+        per_player < MAX_MEMORY_PER_PLAYER
+    ), f"memory per player: {per_player / 1024:.1f}KiB"
+
+
+async def _async_event_storm(
+    hass: HomeAssistant, mock_controllers: dict[str, MagicMock]
+) -> tuple[int, float]:
+    """Returns events sent to every player and CPU time taken to handle them."""
+    await _async_setup_entries(hass)
+
+    devices = [
+        device
+        for controller in mock_controllers.values()
+        for device in await controller.get_devices()
+    ]
+    for device in devices:
+        device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+
+    events = 0
+    started = time.process_time()
+    for i in range(STORM_ROUNDS):
+        play_status = (
+            kaleidescape_const.PLAY_STATUS_PLAYING
+            if i % 2
+            else kaleidescape_const.PLAY_STATUS_PAUSED
+        )
+        for device in devices:
+            device.movie.play_status = play_status
+            device.movie.title_location = i
+            device.automation.screen_mask_ratio = "2.35" if i % 2 else "1.78"
+            for event in STORM_EVENTS:
+                device.dispatcher.send(
+                    kaleidescape_const.SIGNAL_DEVICE_EVENT,
+                    f"#{device.serial_number}",
+                    event,
+                )
+                events += 1
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+    elapsed = time.process_time() - started
+
+    return events, elapsed
+
+
+async def test_scale_event_storm(
+    hass: HomeAssistant,
+    mock_controllers: dict[str, MagicMock],
+    mock_config_entries: list[MockConfigEntry],
+) -> None:
+    """Test concurrent event storms leave every player in the last state."""
+    await _async_event_storm(hass, mock_controllers)
+
+    # Last round left every player playing
+    for entity_id in hass.states.async_entity_ids("media_player"):
+        assert hass.states.get(entity_id).state == STATE_PLAYING
+
+
+@benchmark
+async def test_scale_event_storm_cpu(
+    hass: HomeAssistant,
+    mock_controllers: dict[str, MagicMock],
+    mock_config_entries: list[MockConfigEntry],
+) -> None:
+    """Test CPU cost per device event of concurrent storms stays within budget."""
+    events, elapsed = await _async_event_storm(hass, mock_controllers)
+
+    per_event = elapsed / events
+    assert (
+        per_event < MAX_CPU_PER_EVENT
+    ), f"cpu per event over {events} events: {per_event * 1e6:.0f}us"
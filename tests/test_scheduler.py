@@ -0,0 +1,118 @@
+"""Tests for Kaleidescape command scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from kaleidescape import const as kaleidescape_const
+import pytest
+
+from homeassistant.components.kaleidescape.scheduler import (
+    COMMAND_LEAVE_STANDBY,
+    COMMAND_PAUSE,
+    COMMAND_PLAY,
+    CommandScheduler,
+)
+
+from .conftest import create_kaleidescape_device
+
+
+async def test_satisfied_command_suppressed(mock_kaleidescape: AsyncMock) -> None:
+    """Test commands already satisfied by device state are not sent."""
+    device = create_kaleidescape_device(mock_kaleidescape, "123")
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    device.movie.play_status = kaleidescape_const.PLAY_STATUS_PLAYING
+    scheduler = CommandScheduler(device)
+
+    await scheduler.async_send(COMMAND_LEAVE_STANDBY)
+    await scheduler.async_send(COMMAND_PLAY)
+
+    assert device.leave_standby.call_count == 0
+    assert device.play.call_count == 0
+    assert scheduler.sent == 0
+    assert scheduler.suppressed == 2
+
+
+async def test_burst_collapses_to_last_command(mock_kaleidescape: AsyncMock) -> None:
+    """Test a burst of transport commands collapses to in-flight plus last."""
+    device = create_kaleidescape_device(mock_kaleidescape, "123")
+    release = asyncio.Event()
+
+    async def _slow_play() -> None:
+        await release.wait()
+
+    device.play.side_effect = _slow_play
+    scheduler = CommandScheduler(device)
+
+    tasks = [asyncio.create_task(scheduler.async_send(COMMAND_PLAY))]
+    await asyncio.sleep(0)
+    for command in (COMMAND_PAUSE, COMMAND_PLAY, COMMAND_PAUSE):
+        tasks.append(asyncio.create_task(scheduler.async_send(command)))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert device.play.call_count == 1
+    assert device.pause.call_count == 1
+    assert scheduler.sent == 2
+    assert scheduler.suppressed == 2
+
+
+async def test_failed_command_raises(mock_kaleidescape: AsyncMock) -> None:
+    """Test errors from the device propagate to callers."""
+    device = create_kaleidescape_device(mock_kaleidescape, "123")
+    device.pause.side_effect = ConnectionError
+    scheduler = CommandScheduler(device)
+
+    with pytest.raises(ConnectionError):
+        await scheduler.async_send(COMMAND_PAUSE)
+    assert scheduler.sent == 0
+
+
+async def test_last_command_wins_over_in_flight(mock_kaleidescape: AsyncMock) -> None:
+    """Test a command satisfied now is still sent after a conflicting in-flight one."""
+    device = create_kaleidescape_device(mock_kaleidescape, "123")
+    device.movie.play_status = kaleidescape_const.PLAY_STATUS_PAUSED
+    release = asyncio.Event()
+
+    async def _slow_play() -> None:
+        await release.wait()
+        device.movie.play_status = kaleidescape_const.PLAY_STATUS_PLAYING
+
+    device.play.side_effect = _slow_play
+    scheduler = CommandScheduler(device)
+
+    play = asyncio.create_task(scheduler.async_send(COMMAND_PLAY))
+    await asyncio.sleep(0)
+    pause = asyncio.create_task(scheduler.async_send(COMMAND_PAUSE))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(play, pause)
+
+    assert device.play.call_count == 1
+    assert device.pause.call_count == 1
+    assert scheduler.suppressed == 0
+
+
+async def test_last_command_sent_before_state_event(
+    mock_kaleidescape: AsyncMock,
+) -> None:
+    """Test stale device state does not drop a command after an acked one."""
+    device = create_kaleidescape_device(mock_kaleidescape, "123")
+    device.movie.play_status = kaleidescape_const.PLAY_STATUS_PLAYING
+    scheduler = CommandScheduler(device)
+
+    # Acknowledged, but the play status event has not arrived yet
+    await scheduler.async_send(COMMAND_PAUSE)
+    await scheduler.async_send(COMMAND_PLAY)
+
+    assert device.pause.call_count == 1
+    assert device.play.call_count == 1
+    assert scheduler.suppressed == 0
+
+    # State matching the last command sent is trusted again
+    await scheduler.async_send(COMMAND_PLAY)
+
+    assert device.play.call_count == 1
+    assert scheduler.suppressed == 1
@@ -0,0 +1,110 @@
+"""Tests for Kaleidescape screen mask fast path."""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from kaleidescape import const as kaleidescape_const
+
+from homeassistant.components.kaleidescape.const import SIGNAL_SCREEN_MASK
+from homeassistant.components.kaleidescape.screen_mask import ScreenMaskEvent
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .conftest import benchmark
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from tests.common import MockConfigEntry
+
+BENCHMARK_EVENTS = 1000
+MAX_P99_LATENCY = 0.005
+
+RATIOS = ["1.33", "1.78", "1.85", "2.35"]
+
+
+def _send_mask_event(kaleidescape: AsyncMock) -> None:
+    kaleidescape.dispatcher.send(
+        kaleidescape_const.SIGNAL_DEVICE_EVENT, "#123", kaleidescape_const.SCREEN_MASK
+    )
+
+
+async def test_screen_mask_signal(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test mask changes are sent as typed events, duplicates are dropped."""
+    device = await mock_kaleidescape.get_local_device()
+    received: list[ScreenMaskEvent] = []
+    async_dispatcher_connect(hass, SIGNAL_SCREEN_MASK, callback(received.append))
+
+    device.automation.screen_mask_ratio = "2.35"
+    device.automation.screen_mask_top_trim_rel = 2
+    for _ in range(2):
+        _send_mask_event(mock_kaleidescape)
+        await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+    assert len(received) == 1
+    assert received[0].serial_number == "123"
+    assert received[0].ratio == "2.35"
+    assert received[0].top_trim_rel == 2
+
+
+async def test_screen_mask_order(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test every mask change is delivered once, in order."""
+    device = await mock_kaleidescape.get_local_device()
+    received: list[ScreenMaskEvent] = []
+    async_dispatcher_connect(hass, SIGNAL_SCREEN_MASK, callback(received.append))
+
+    for ratio in RATIOS:
+        device.automation.screen_mask_ratio = ratio
+        _send_mask_event(mock_kaleidescape)
+        await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+    assert [event.ratio for event in received] == RATIOS
+    assert all(a.received <= b.received for a, b in zip(received, received[1:]))
+
+
+@benchmark
+async def test_screen_mask_latency(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Benchmark device event to subscriber latency with a simulated source."""
+    device = await mock_kaleidescape.get_local_device()
+    latencies: list[float] = []
+    sent_at = 0.0
+
+    @callback
+    def _mask_changed(event: ScreenMaskEvent) -> None:
+        latencies.append(time.perf_counter() - sent_at)
+
+    async_dispatcher_connect(hass, SIGNAL_SCREEN_MASK, _mask_changed)
+
+    for i in range(BENCHMARK_EVENTS):
+        device.automation.screen_mask_ratio = RATIOS[i % len(RATIOS)]
+        sent_at = time.perf_counter()
+        _send_mask_event(mock_kaleidescape)
+        # Delivery takes several loop iterations, wait for it before the next send
+        await asyncio.sleep(0)
+        await hass.async_block_till_done()
+        assert len(latencies) == i + 1
+
+    assert len(latencies) == BENCHMARK_EVENTS
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    assert p99 < MAX_P99_LATENCY, f"p50 {p50 * 1e6:.0f}us, p99 {p99 * 1e6:.0f}us"
@@ -0,0 +1,135 @@
+"""Tests for Kaleidescape sensor platform."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from kaleidescape.error import KaleidescapeError
+import pytest
+
+from homeassistant.components.kaleidescape.const import DOMAIN
+from homeassistant.components.kaleidescape.watchdog import (
+    MAX_COMMAND_TIMEOUT,
+    MAX_FAILED_PROBES,
+    MIN_COMMAND_TIMEOUT,
+    PROBE_INTERVAL,
+)
+from homeassistant.const import STATE_UNKNOWN
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from tests.common import MockConfigEntry
+
+ENTITY_ID = "sensor.device_123_kaleidescape_round_trip_time"
+
+
+async def test_rtt_sensor(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test round trip time sensor reports watchdog estimate."""
+    entity = hass.states.get(ENTITY_ID)
+    assert entity is not None
+    assert entity.state != STATE_UNKNOWN
+    assert entity.attributes["failed_probes"] == 0
+
+    watchdog = hass.data[DOMAIN][mock_integration.entry_id].watchdog
+    watchdog.add_sample(0.040)
+    await watchdog.async_probe()
+    await hass.async_block_till_done()
+
+    entity = hass.states.get(ENTITY_ID)
+    assert float(entity.state) > 0
+
+
+async def test_adaptive_timeouts(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test command timeout follows the smoothed RTT within limits."""
+    watchdog = hass.data[DOMAIN][mock_integration.entry_id].watchdog
+    watchdog.srtt = None
+
+    for _ in range(20):
+        watchdog.add_sample(0.010)
+    assert watchdog.command_timeout == MIN_COMMAND_TIMEOUT
+
+    for _ in range(20):
+        watchdog.add_sample(3.0)
+    assert MIN_COMMAND_TIMEOUT < watchdog.command_timeout <= MAX_COMMAND_TIMEOUT
+    assert watchdog.connect_timeout >= watchdog.command_timeout
+
+
+async def test_stalled_probes_reconnect(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test the connection is re-established when probes keep failing."""
+    device = await mock_kaleidescape.get_local_device()
+    device.get_friendly_system_name.side_effect = KaleidescapeError
+    watchdog = hass.data[DOMAIN][mock_integration.entry_id].watchdog
+    connects = mock_kaleidescape.connect.call_count
+
+    for _ in range(MAX_FAILED_PROBES):
+        await watchdog.async_probe()
+    await hass.async_block_till_done()
+
+    assert mock_kaleidescape.disconnect.call_count == 1
+    assert mock_kaleidescape.connect.call_count == connects + 1
+    assert watchdog.reconnects == 1
+    assert watchdog.failed_probes == 0
+    assert hass.states.get(ENTITY_ID).attributes["reconnects"] == 1
+
+
+@pytest.mark.parametrize(
+    "mock_kaleidescape", [[("123", True), ("234", False)]], indirect=True
+)
+async def test_one_rtt_sensor_per_system(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test only the local device gets a round trip time sensor."""
+    assert hass.states.get(ENTITY_ID) is not None
+    assert hass.states.get("sensor.device_234_kaleidescape_round_trip_time") is None
+
+
+async def test_unload_cancels_reconnect(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test unloading waits for an in-flight reconnect to be cancelled."""
+    device = await mock_kaleidescape.get_local_device()
+    device.get_friendly_system_name.side_effect = KaleidescapeError
+    watchdog = hass.data[DOMAIN][mock_integration.entry_id].watchdog
+    watchdog.failed_probes = MAX_FAILED_PROBES - 1
+    connecting = asyncio.Event()
+    cancelled = False
+
+    async def _hanging_connect(*args, **kwargs) -> None:
+        nonlocal cancelled
+        connecting.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    mock_kaleidescape.connect.side_effect = _hanging_connect
+    async_fire_time_changed(hass, dt_util.utcnow() + PROBE_INTERVAL)
+    await asyncio.wait_for(connecting.wait(), 1)
+
+    assert await hass.config_entries.async_unload(mock_integration.entry_id)
+    await hass.async_block_till_done()
+
+    assert cancelled
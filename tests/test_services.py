@@ -0,0 +1,159 @@
+"""Tests for Kaleidescape integration services."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from kaleidescape import const as kaleidescape_const
+import pytest
+
+from homeassistant.components.kaleidescape.const import (
+    DOMAIN,
+    EVENT_COMMAND_RESULT,
+    SERVICE_SEND_TO_PLAYERS,
+    SERVICE_STANDBY_ALL,
+)
+from homeassistant.components.media_player.const import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF
+
+from tests.common import async_capture_events
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from tests.common import MockConfigEntry
+
+
+@pytest.mark.parametrize(
+    "mock_kaleidescape", [[("123", True), ("234", False), ("345", False)]], indirect=True
+)
+async def test_standby_all(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test standby_all commands every player concurrently."""
+    devices = await mock_kaleidescape.get_devices()
+    devices[0].power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    devices[1].power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    devices[1].enter_standby.side_effect = ConnectionError
+    events = async_capture_events(hass, EVENT_COMMAND_RESULT)
+
+    await hass.services.async_call(DOMAIN, SERVICE_STANDBY_ALL, {}, blocking=True)
+    await hass.async_block_till_done()
+
+    assert devices[0].enter_standby.call_count == 1
+    assert devices[1].enter_standby.call_count == 1
+    assert devices[2].enter_standby.call_count == 0
+    assert len(events) == 1
+    assert events[0].data["results"] == {
+        "123": "ok",
+        "234": "error",
+        "345": "skipped",
+    }
+
+
+@pytest.mark.parametrize(
+    "mock_kaleidescape", [[("123", True), ("234", False)]], indirect=True
+)
+async def test_send_to_players(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test send_to_players only commands the selected players."""
+    devices = await mock_kaleidescape.get_devices()
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SEND_TO_PLAYERS,
+        {ATTR_ENTITY_ID: "media_player.device_234_kaleidescape", "command": "stop"},
+        blocking=True,
+    )
+
+    assert devices[0].stop.call_count == 0
+    assert devices[1].stop.call_count == 1
+
+
+async def test_send_to_players_timeout(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test a slow player is reported as timed out."""
+    device = await mock_kaleidescape.get_local_device()
+
+    async def _slow_play() -> None:
+        await asyncio.sleep(10)
+
+    device.play.side_effect = _slow_play
+    events = async_capture_events(hass, EVENT_COMMAND_RESULT)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SEND_TO_PLAYERS,
+        {"command": "play", "timeout": 0.1},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert events[0].data["results"] == {"123": "timeout"}
+
+
+async def test_services_removed_on_unload(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test services are removed when the last entry unloads."""
+    assert hass.services.has_service(DOMAIN, SERVICE_STANDBY_ALL)
+
+    await hass.config_entries.async_unload(mock_integration.entry_id)
+    await hass.async_block_till_done()
+
+    assert not hass.services.has_service(DOMAIN, SERVICE_STANDBY_ALL)
+    assert not hass.services.has_service(DOMAIN, SERVICE_SEND_TO_PLAYERS)
+
+
+async def test_standby_all_shares_entity_scheduler(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+) -> None:
+    """Test group and entity commands for a player collapse together."""
+    device = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    release = asyncio.Event()
+
+    async def _slow_enter_standby() -> None:
+        await release.wait()
+        device.power.state = kaleidescape_const.DEVICE_POWER_STATE_STANDBY
+
+    device.enter_standby.side_effect = _slow_enter_standby
+
+    standby_all = hass.async_create_task(
+        hass.services.async_call(DOMAIN, SERVICE_STANDBY_ALL, {}, blocking=True)
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert device.enter_standby.call_count == 1
+    turn_off = hass.async_create_task(
+        hass.services.async_call(
+            MEDIA_PLAYER_DOMAIN,
+            SERVICE_TURN_OFF,
+            {ATTR_ENTITY_ID: "media_player.device_123_kaleidescape"},
+            blocking=True,
+        )
+    )
+    # Let the entity command reach the scheduler while standby is in flight
+    for _ in range(10):
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(standby_all, turn_off)
+
+    assert device.enter_standby.call_count == 1
+    scheduler = hass.data[DOMAIN][mock_integration.entry_id].schedulers["123"]
+    assert scheduler.sent == 1
+    assert scheduler.suppressed == 1
@@ -0,0 +1,115 @@
+"""Tests for Kaleidescape event subscription profiles."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from kaleidescape import const as kaleidescape_const
+
+from homeassistant.components.kaleidescape.const import (
+    CONF_BRIDGE_EVENTS,
+    CONF_EVENTS,
+    CONF_PROFILE,
+    DOMAIN,
+    PROFILE_CUSTOM,
+    PROFILE_FULL,
+    PROFILE_TRANSPORT,
+    SIGNAL_SCREEN_MASK,
+)
+from homeassistant.components.kaleidescape.subscription import subscribed_events
+from homeassistant.const import CONF_HOST, CONF_ID, STATE_IDLE
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from tests.common import MockConfigEntry
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def _setup_entry(hass: HomeAssistant, options: dict) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="123456789",
+        version=2,
+        data={CONF_ID: "123456789", CONF_HOST: "127.0.0.1"},
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def _send_event(hass: HomeAssistant, kaleidescape: AsyncMock, event: str):
+    kaleidescape.dispatcher.send(kaleidescape_const.SIGNAL_DEVICE_EVENT, "#123", event)
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+
+def test_subscribed_events() -> None:
+    """Test events subscribed by each profile."""
+    assert subscribed_events({}) is None
+    assert subscribed_events({CONF_PROFILE: PROFILE_FULL}) is None
+    assert subscribed_events({CONF_PROFILE: PROFILE_TRANSPORT}) == {
+        kaleidescape_const.DEVICE_POWER_STATE,
+        kaleidescape_const.FRIENDLY_NAME,
+        kaleidescape_const.PLAY_STATUS,
+    }
+    assert subscribed_events(
+        {
+            CONF_PROFILE: PROFILE_CUSTOM,
+            CONF_EVENTS: [kaleidescape_const.SCREEN_MASK],
+            CONF_BRIDGE_EVENTS: [kaleidescape_const.VIDEO_COLOR],
+        }
+    ) == {
+        kaleidescape_const.SCREEN_MASK,
+        kaleidescape_const.CINEMASCAPE_MASK,
+        kaleidescape_const.VIDEO_COLOR,
+    }
+
+
+async def test_full_profile_uses_controller_dispatcher(
+    hass: HomeAssistant, mock_kaleidescape: AsyncMock
+) -> None:
+    """Test the full profile adds no filtering."""
+    entry = await _setup_entry(hass, {CONF_PROFILE: PROFILE_FULL})
+    data = hass.data[DOMAIN][entry.entry_id]
+    assert data.dispatcher is mock_kaleidescape.dispatcher
+
+
+async def test_transport_profile(
+    hass: HomeAssistant, mock_kaleidescape: AsyncMock
+) -> None:
+    """Test unsubscribed events are dropped before reaching entities."""
+    entry = await _setup_entry(hass, {CONF_PROFILE: PROFILE_TRANSPORT})
+    dispatcher = hass.data[DOMAIN][entry.entry_id].dispatcher
+    device = await mock_kaleidescape.get_local_device()
+    masks = []
+    async_dispatcher_connect(hass, SIGNAL_SCREEN_MASK, callback(masks.append))
+
+    device.automation.screen_mask_ratio = "2.35"
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.SCREEN_MASK)
+    state = hass.states.get("media_player.device_123_kaleidescape")
+    assert state.attributes.get("screen_mask_ratio") != "2.35"
+    assert len(masks) == 0
+    assert dispatcher.dropped == 1
+
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    await _send_event(hass, mock_kaleidescape, kaleidescape_const.DEVICE_POWER_STATE)
+    state = hass.states.get("media_player.device_123_kaleidescape")
+    assert state.state == STATE_IDLE
+    assert dispatcher.dropped == 1
+
+    # Controller events are always delivered
+    mock_kaleidescape.dispatcher.send(
+        kaleidescape_const.SIGNAL_CONTROLLER_EVENT,
+        kaleidescape_const.EVENT_CONTROLLER_UPDATED,
+    )
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,151 @@
+"""Tests for Kaleidescape usage statistics."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from kaleidescape import const as kaleidescape_const
+from kaleidescape.device import Movie
+import pytest
+
+from homeassistant.components.kaleidescape.const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from tests.common import MockConfigEntry
+
+
+@pytest.fixture(name="mock_time")
+def fixture_mock_time() -> MagicMock:
+    """Returns a controllable clock for usage statistics."""
+    with patch("homeassistant.components.kaleidescape.usage.time") as mock:
+        mock.monotonic.return_value = 0.0
+        yield mock
+
+
+async def _play_status(
+    hass: HomeAssistant,
+    kaleidescape: AsyncMock,
+    mock_time: MagicMock,
+    at: float,
+    **movie,
+) -> None:
+    device = await kaleidescape.get_local_device()
+    device.movie = Movie(handle="handle", title_length=7200, **movie)
+    mock_time.monotonic.return_value = at
+    kaleidescape.dispatcher.send(
+        kaleidescape_const.SIGNAL_DEVICE_EVENT, "#123", kaleidescape_const.PLAY_STATUS
+    )
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+
+async def test_watch_session(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+    mock_time: MagicMock,
+) -> None:
+    """Test a watched title updates the statistics sensors."""
+    device = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    playing = kaleidescape_const.PLAY_STATUS_PLAYING
+
+    await _play_status(hass, mock_kaleidescape, mock_time, 0, play_status=playing)
+    state = hass.states.get("sensor.device_123_kaleidescape_titles_started")
+    assert state.state == "1"
+    assert state.attributes["current_title"] == 1
+
+    # Pausing stops the clock
+    await _play_status(
+        hass,
+        mock_kaleidescape,
+        mock_time,
+        3600,
+        play_status=kaleidescape_const.PLAY_STATUS_PAUSED,
+    )
+    await _play_status(hass, mock_kaleidescape, mock_time, 5400, play_status=playing)
+    await _play_status(
+        hass,
+        mock_kaleidescape,
+        mock_time,
+        9000,
+        play_status=playing,
+        title_location=7000,
+    )
+    await _play_status(
+        hass,
+        mock_kaleidescape,
+        mock_time,
+        9000,
+        play_status=kaleidescape_const.PLAY_STATUS_NONE,
+    )
+
+    prefix = "sensor.device_123_kaleidescape"
+    assert hass.states.get(f"{prefix}_hours_played").state == "2.0"
+    assert hass.states.get(f"{prefix}_titles_finished").state == "1"
+    assert hass.states.get(f"{prefix}_average_session_length").state == "120.0"
+
+    statistics = hass.data[DOMAIN][mock_integration.entry_id].statistics
+    assert statistics.titles["handle"].played_seconds == 7200
+    assert statistics.titles["handle"].finished == 1
+
+
+async def test_statistics_persisted(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+    mock_time: MagicMock,
+) -> None:
+    """Test counters survive reloading the entry."""
+    device = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    playing = kaleidescape_const.PLAY_STATUS_PLAYING
+
+    await _play_status(hass, mock_kaleidescape, mock_time, 0, play_status=playing)
+    await _play_status(hass, mock_kaleidescape, mock_time, 1800, play_status=playing)
+
+    await hass.config_entries.async_reload(mock_integration.entry_id)
+    await hass.async_block_till_done()
+
+    statistics = hass.data[DOMAIN][mock_integration.entry_id].statistics
+    assert statistics.player("123").played_seconds == 1800
+    assert statistics.player("123").sessions == 0
+    assert statistics.current_handle("123") == "handle"
+
+
+async def test_session_resumed_after_reload(
+    hass: HomeAssistant,
+    mock_kaleidescape: AsyncMock,
+    mock_integration: MockConfigEntry,
+    mock_time: MagicMock,
+) -> None:
+    """Test reloading during a title does not count a new start or session."""
+    device = await mock_kaleidescape.get_local_device()
+    device.power.state = kaleidescape_const.DEVICE_POWER_STATE_ON
+    playing = kaleidescape_const.PLAY_STATUS_PLAYING
+
+    await _play_status(hass, mock_kaleidescape, mock_time, 0, play_status=playing)
+    mock_time.monotonic.return_value = 1800
+    await hass.config_entries.async_reload(mock_integration.entry_id)
+    await hass.async_block_till_done()
+
+    # Time between unload and the first event after setup is not counted
+    await _play_status(hass, mock_kaleidescape, mock_time, 2000, play_status=playing)
+    await _play_status(
+        hass,
+        mock_kaleidescape,
+        mock_time,
+        3800,
+        play_status=kaleidescape_const.PLAY_STATUS_NONE,
+    )
+
+    statistics = hass.data[DOMAIN][mock_integration.entry_id].statistics
+    for counters in (statistics.player("123"), statistics.title("handle")):
+        assert counters.started == 1
+        assert counters.sessions == 1
+        assert counters.played_seconds == 3600
+        assert counters.average_session_seconds == 3600